@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Balance Core - Anthropic account balance check, with no heavy imports
+
+Leaf module shared by core/track_usage.py and scripts/check_balance_alert.py.
+Stdlib only at import time (urllib instead of requests; keyring imported on
+call), so the frequent balance alert doesn't pay for the usage tracker's
+import graph.
+"""
+
+import json
+import urllib.request
+from typing import Optional, Tuple
+
+BALANCE_URL = 'https://api.anthropic.com/v1/organization/balance'
+
+# Balance thresholds
+BALANCE_THRESHOLDS = {
+    'getting_low': 10.0,
+    'critically_low': 5.0,
+    'severely_low': 1.0
+}
+
+def check_balance() -> Tuple[Optional[float], Optional[str]]:
+    """
+    Check Anthropic account balance and return (balance, warning_level).
+    Returns (None, None) if unable to fetch balance.
+    Warning levels: 'SEVERE', 'CRITICAL', 'WARNING', or None
+    """
+
+    try:
+        import keyring
+        api_key = keyring.get_password('anthropic', 'api_key')
+
+    except Exception:
+        api_key = None
+
+    if not api_key:
+        return None, None
+    
+    try:
+        request = urllib.request.Request(
+            BALANCE_URL,
+            headers={
+                'x-api-key': api_key,
+                'anthropic-version': '2023-06-01'
+            }
+        )
+        with urllib.request.urlopen(request, timeout=5) as response:
+            if response.status != 200:
+                return None, None
+            data = json.loads(response.read())
+        
+        # Balance is typically in cents
+        balance = data.get('balance', 0) / 100.0
+        
+        # Check thresholds
+        if balance <= BALANCE_THRESHOLDS['severely_low']:
+            return balance, 'SEVERE'
+        elif balance <= BALANCE_THRESHOLDS['critically_low']:
+            return balance, 'CRITICAL'
+        elif balance <= BALANCE_THRESHOLDS['getting_low']:
+            return balance, 'WARNING'
+        else:
+            return balance, None
+            
+    except Exception as e:
+        # Silently fail - balance check is optional (HTTPError covers non-2xx)
+        return None, None
@@ -200,6 +200,15 @@ def send_briefing(token, chat_id):
     send_message(token, chat_id, "✅ Briefing complete. Tap buttons to give feedback.")
     print(f"✅ Sent {len(articles[:10])} articles to Telegram")
 
+# curator_output.txt article blocks (see parse_curator_output)
+_ARTICLE_SPLIT_RE = re.compile(r'\n#(\d+) ')
+_ARTICLE_SOURCE_RE = re.compile(r'\[(.*?)\]')
+_ARTICLE_CATEGORY_RE = re.compile(r'🏷️\s+(\w+)')
+_ARTICLE_SCORE_RE = re.compile(r'Scores:\s+([\d.]+)/10')
+_ARTICLE_URL_LINE_RE = re.compile(r'^https?://.*', re.M)
+_ARTICLE_TITLE_LINE_RE = re.compile(r'^(?!ID:|https?://|Published:|Scores:).+', re.M)
+_ARTICLE_SCORES_LINE_RE = re.compile(r'^.*Scores:.*', re.M)
+
 def parse_curator_output(path):
     """
     Parse curator_output.txt into list of article dicts.
@@ -212,13 +221,22 @@ def parse_curator_output(path):
        Scores: X/10 (raw: X, final: X)
        snippet...
     """
-    import re
-
     articles = []
-    content = path.read_text()
+    # Only the "TOP N CURATED ARTICLES" section onward holds articles: stream
+    # past any run log ahead of it and read just the rest (older files lack
+    # the marker and are read whole)
+    with open(path) as f:
+        for line in f:
+            start = line.find('CURATED ARTICLES')
+            if start >= 0:
+                content = line[start:] + f.read()
+                break
+        else:
+            f.seek(0)
+            content = f.read()
 
     # Split on article markers (#1, #2, etc.)
-    sections = re.split(r'\n#(\d+) ', content)
+    sections = _ARTICLE_SPLIT_RE.split(content)
 
     for i in range(1, len(sections), 2):
         num = sections[i]
@@ -230,42 +248,30 @@ def parse_curator_output(path):
 
         # Parse header line: [Source] 🏷️  category (model)
         header = lines[0]
-        source_match = re.search(r'\[(.*?)\]', header)
-        category_match = re.search(r'🏷️\s+(\w+)', header)
+        source_match = _ARTICLE_SOURCE_RE.search(header)
+        category_match = _ARTICLE_CATEGORY_RE.search(header)
 
         source = source_match.group(1) if source_match else "Unknown"
         category = category_match.group(1) if category_match else "other"
 
+        # Each scan runs over the stripped lines below the header in one call
+        body = '\n'.join(lines[1:])
+
         # Find URL by pattern (robust against added/removed lines above it)
-        url = "unknown"
-        for line in lines[1:]:
-            if line.startswith('http://') or line.startswith('https://'):
-                url = line
-                break
+        url_match = _ARTICLE_URL_LINE_RE.search(body)
+        url = url_match.group(0) if url_match else "unknown"
 
         # Find title: first non-empty line that isn't the ID, a URL, Published, or Scores
-        title = "Unknown"
-        for line in lines[1:]:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            if stripped.startswith('ID:'):
-                continue
-            if stripped.startswith('http://') or stripped.startswith('https://'):
-                continue
-            if stripped.startswith('Published:') or stripped.startswith('Scores:'):
-                continue
-            title = stripped
-            break
+        title_match = _ARTICLE_TITLE_LINE_RE.search(body)
+        title = title_match.group(0) if title_match else "Unknown"
 
         # Parse score
         score = "?"
-        for line in lines:
-            if 'Scores:' in line:
-                score_match = re.search(r'Scores:\s+([\d.]+)/10', line)
-                if score_match:
-                    score = score_match.group(1)
-                break
+        scores_line = _ARTICLE_SCORES_LINE_RE.search(header) or _ARTICLE_SCORES_LINE_RE.search(body)
+        if scores_line:
+            score_match = _ARTICLE_SCORE_RE.search(scores_line.group(0))
+            if score_match:
+                score = score_match.group(1)
 
         articles.append({
             'num': num,
@@ -12,13 +12,18 @@ Tracks:
 Storage: JSON (for now) → migrate to Postgres later
 """
 
-import keyring
 import json
 import os
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List
+
+try:
+    from core.balance_core import BALANCE_THRESHOLDS, check_balance
+except ImportError:
+    # Run directly as core/track_usage.py (cron wrapper) — core/ is on sys.path
+    from balance_core import BALANCE_THRESHOLDS, check_balance
 
 # Pricing (as of Feb 2026 - Claude Sonnet 4)
 PRICING = {
@@ -30,61 +35,6 @@ PRICING = {
 
 USAGE_LOG = Path.home() / ".openclaw" / "workspace" / "logs" / "usage" / "daily_usage.json"
 
-# Balance thresholds
-BALANCE_THRESHOLDS = {
-    'getting_low': 10.0,
-    'critically_low': 5.0,
-    'severely_low': 1.0
-}
-
-def check_balance() -> Tuple[Optional[float], Optional[str]]:
-    """
-    Check Anthropic account balance and return (balance, warning_level).
-    Returns (None, None) if unable to fetch balance.
-    Warning levels: 'SEVERE', 'CRITICAL', 'WARNING', or None
-    """
-
-    try:
-        api_key = keyring.get_password('anthropic', 'api_key')
-
-    except:
-        api_key = None
-
-    if not api_key:
-        return None, None
-    
-    try:
-        import requests
-        response = requests.get(
-            'https://api.anthropic.com/v1/organization/balance',
-            headers={
-                'x-api-key': api_key,
-                'anthropic-version': '2023-06-01'
-            },
-            timeout=5
-        )
-        
-        if response.status_code != 200:
-            return None, None
-        
-        data = response.json()
-        # Balance is typically in cents
-        balance = data.get('balance', 0) / 100.0
-        
-        # Check thresholds
-        if balance <= BALANCE_THRESHOLDS['severely_low']:
-            return balance, 'SEVERE'
-        elif balance <= BALANCE_THRESHOLDS['critically_low']:
-            return balance, 'CRITICAL'
-        elif balance <= BALANCE_THRESHOLDS['getting_low']:
-            return balance, 'WARNING'
-        else:
-            return balance, None
-            
-    except Exception as e:
-        # Silently fail - balance check is optional
-        return None, None
-
 def load_usage_log() -> Dict:
     """Load existing usage log or create new"""
     if USAGE_LOG.exists():
@@ -1,32 +1,49 @@
 from neo4j import GraphDatabase
+from functools import lru_cache
+from itertools import islice
+import atexit
 import datetime
 
 URI = "bolt://localhost:7687"
 AUTH = ("neo4j", "***REDACTED***")
 
-driver = GraphDatabase.driver(URI, auth=AUTH)
+BATCH_SIZE = 1000   # rows per UNWIND transaction
 
-def create_decision(tx, thought, motive):
-    tx.run(
-        "CREATE (d:Decision {thought: $thought, motive: $motive, timestamp: $timestamp})",
-        thought=thought,
-        motive=motive,
-        timestamp=datetime.datetime.now().isoformat()
+@lru_cache(maxsize=1)
+def get_driver():
+    # One pooled driver per process — avoids a fresh Bolt handshake per call
+    driver = GraphDatabase.driver(
+        URI,
+        auth=AUTH,
+        max_connection_pool_size=50,
+        connection_acquisition_timeout=30,
+        max_transaction_retry_time=15,
     )
+    atexit.register(driver.close)
+    return driver
 
-with driver.session() as session:
-    session.execute_write(
-        create_decision,
-        thought="Local-first personalized AI foundation established (January 7, 2026)",
-        motive=(
+def create_decisions(tx, rows):
+    # One round-trip per batch: each row is {"thought", "motive", "timestamp"}
+    tx.run("UNWIND $rows AS r CREATE (d:Decision) SET d = r", rows=rows)
+
+def write_decisions(session, rows, batch_size=BATCH_SIZE):
+    rows = iter(rows)
+    while batch := list(islice(rows, batch_size)):
+        session.execute_write(create_decisions, batch)
+
+with get_driver().session() as session:
+    session.run("CREATE INDEX IF NOT EXISTS FOR (d:Decision) ON (d.timestamp)")
+    write_decisions(session, [{
+        "thought": "Local-first personalized AI foundation established (January 7, 2026)",
+        "motive": (
             "Successfully built clean repo, Ollama + gemma3:1b local inference, Docker infra with Neo4j and PostgreSQL "
             "(resolved Postgres 18 volume mount issue, venv/PATH problems, and multiple setup hurdles). "
             "Overcame every obstacle through persistent, systematic rebuilding and research. "
             "Chose local-first architecture for privacy, speed, and deliberate evolution — consistent with complexity science view "
             "that robust systems emerge from iterative adaptation under uncertainty. "
             "This seed node begins the context graph that will allow agents to learn and reflect my motives, precedents, and worldview over time."
-        )
-    )
+        ),
+        "timestamp": datetime.datetime.now().isoformat(),
+    }])
 
 print("✅ First decision trace permanently stored in context graph!")
-driver.close()
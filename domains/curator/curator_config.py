@@ -12,18 +12,20 @@ When adding a new knowledge domain:
   4. Build the domain-specific front-end + scheduler independently
 """
 
+from types import MappingProxyType
+
 # ── Canonical knowledge domain names ──────────────────────────────────────
 # These are the bucket names used in domain_signals in curator_preferences.json.
 # Each domain is an independent product: own front-end, own schedule, own signals.
 
-DOMAINS = [
+DOMAINS = (
     "Finance and Geopolitics",   # Active — morning briefing (investing decisions)
     "Health and Science",        # Future — different cadence
     "Tech and AI",               # Future
     "Language and Culture",      # Future
     "Career and Commercial",     # Future
     "Other",                     # Catch-all for unmapped folders
-]
+)
 
 # ── Active domain for the current briefing job ────────────────────────────
 # This is what curator_rss_v2.py reads from domain_signals.
@@ -39,14 +41,18 @@ ACTIVE_DOMAIN = "Finance and Geopolitics"
 #
 # Add new folders here as you create them in X.
 # Format: 'X_folder_id': 'Canonical Domain Name'
+# Read-only view — edit this literal, not the mapping at runtime.
+# Keys stay strings: the X API and archive hand us bookmarkCollectionId as a
+# string, and str hashes are cached per object, so int keys would only add an
+# int() conversion (and '' / unfiled handling) at every lookup site.
 
-KNOWN_FOLDERS = {
+KNOWN_FOLDERS = MappingProxyType({
     '1926124453714387081': 'Finance and Geopolitics',   # X folder: "Finance and geopolitics"
     '1881118951536538102': 'Language and Culture',      # X folder: "Learning 2025"
     '1926123095779078526': 'Health and Science',        # X folder: "Life and health"
     '1967313159158640645': 'Tech and AI',               # X folder: "Tech"
     '1992980059464876233': 'Career and Commercial',     # X folder: "Modular Construction"
-}
+})
 
 # ── Enrichment backend ────────────────────────────────────────────────────
 # Controls which LLM is used for tweet text analysis in enrich_signals.py.
@@ -11,6 +11,9 @@ USAGE:
   
   # Save to interests directory
   python curator_deepdive.py --rank=6 --save-interest
+  
+  # Repeat runs of the same prompt are served from ~/.openclaw/cache/deepdive;
+  # force a fresh Sonnet call with --no-cache
 
 COST: ~$0.10-0.20 per deep dive (Sonnet analysis)
 
@@ -22,16 +25,43 @@ OUTPUT:
 
 import sys
 import os
+import hashlib
 import json
+import re
 import argparse
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, TextIO, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add project directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from curator_rss_v2 import get_anthropic_api_key
+@lru_cache(maxsize=1)
+def get_anthropic_api_key() -> Optional[str]:
+    """Keychain/env lookup, done once per process."""
+    # Imported here: curator_rss_v2 pulls in the anthropic/httpx stack, which
+    # --help and argument errors never need
+    from curator_rss_v2 import get_anthropic_api_key as lookup_anthropic_api_key
+    return lookup_anthropic_api_key()
+
+@lru_cache(maxsize=1)
+def get_client():
+    """One Anthropic client per process, so batch runs reuse its HTTP connection pool."""
+    from anthropic import Anthropic
+    
+    api_key = get_anthropic_api_key()
+    if not api_key:
+        print("❌ Anthropic API key not found")
+        print("   Run: python setup_keys.py")
+        sys.exit(1)
+    
+    return Anthropic(api_key=api_key)
 
 def get_article_from_briefing(rank: int) -> Optional[Dict]:
     """
@@ -64,6 +94,14 @@ def fetch_article_content(url: str) -> str:
     print(f"   Will use article title + summary for now")
     return ""
 
+# (path, mtime_ns, size, max_examples) -> guidance block. ratings.json changes
+# rarely, so repeat prompt builds in one process skip the parse + format.
+_RATINGS_CACHE: Dict[Tuple[str, int, int, int], str] = {}
+
+# Smallest ratings.json that can yield guidance: {"ratings":[{"stars":1},{}]}.
+# Anything shorter (empty file, {"ratings": []} skeleton) is skipped unparsed.
+_MIN_RATINGS_BYTES = 28
+
 def load_dive_ratings(max_examples: int = 3) -> str:
     """
     Read interests/ratings.json and build a quality guidance block.
@@ -77,8 +115,26 @@ def load_dive_ratings(max_examples: int = 3) -> str:
     ratings_path = Path(__file__).parent.parent.parent / 'interests' / 'ratings.json'
 
     try:
-        with open(ratings_path) as f:
-            data = json.load(f)
+        st = ratings_path.stat()
+    except OSError:
+        return ""
+    if st.st_size < _MIN_RATINGS_BYTES:
+        return ""
+    key = (str(ratings_path), st.st_mtime_ns, st.st_size, max_examples)
+    if key in _RATINGS_CACHE:
+        return _RATINGS_CACHE[key]
+
+    block = _build_ratings_block(ratings_path, max_examples)
+    _RATINGS_CACHE.clear()   # only the current file version is worth keeping
+    _RATINGS_CACHE[key] = block
+    return block
+
+
+def _build_ratings_block(ratings_path: Path, max_examples: int) -> str:
+    try:
+        with open(ratings_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:
         return ""
 
@@ -87,8 +143,14 @@ def load_dive_ratings(max_examples: int = 3) -> str:
     if len(ratings) < 2:
         return ""  # Not enough signal yet
 
-    high = [r for r in ratings if r.get('stars', 0) >= 3]
-    low  = [r for r in ratings if 1 <= r.get('stars', 0) <= 2]
+    # One pass, one stars lookup per rating
+    high, low = [], []
+    for r in ratings:
+        stars = r.get('stars', 0)
+        if stars >= 3:
+            high.append(r)
+        elif 1 <= stars <= 2:
+            low.append(r)
 
     if not high and not low:
         return ""
@@ -98,7 +160,8 @@ def load_dive_ratings(max_examples: int = 3) -> str:
     if high:
         sections.append("High-rated dives (3-4★) — what worked:")
         for r in high[-max_examples:]:
-            line = f"  • {r.get('article_title', 'Unknown')[:60]}"
+            title = r.get('article_title', 'Unknown')[:60]
+            line = f"  • {title}"
             if r.get('user_comment'):
                 line += f" → \"{r['user_comment']}\""
             if r.get('ai_themes'):
@@ -108,7 +171,8 @@ def load_dive_ratings(max_examples: int = 3) -> str:
     if low:
         sections.append("Low-rated dives (1-2★) — what didn't work:")
         for r in low[-max_examples:]:
-            line = f"  • {r.get('article_title', 'Unknown')[:60]}"
+            title = r.get('article_title', 'Unknown')[:60]
+            line = f"  • {title}"
             if r.get('user_comment'):
                 line += f" → \"{r['user_comment']}\""
             if r.get('ai_themes'):
@@ -122,26 +186,9 @@ def load_dive_ratings(max_examples: int = 3) -> str:
     return block
 
 
-def build_deepdive_prompt(article_data: Dict, full_content: str = "") -> str:
-    """
-    Build Sonnet prompt for deep analysis
-    
-    Focuses on:
-    - Key implications (what this really means)
-    - Contrarian angles (what others miss)
-    - Geopolitical context (connections)
-    - Investment/policy angles (actionable insights)
-    """
-    
-    title = article_data.get('title', 'Unknown')
-    source = article_data.get('source', 'Unknown')
-    url = article_data.get('url', 'Unknown')
-    summary = article_data.get('summary', '')
-    category = article_data.get('category', 'other')
-    
-    ratings_guidance = load_dive_ratings()
-
-    prompt = f"""You are a geopolitics & finance analyst doing DEEP ANALYSIS on a flagged article.
+# Sonnet deep-dive prompt scaffold, parsed once; filled by build_deepdive_prompt.
+# Fields: title, source, category, url, summary, ratings_guidance.
+DEEPDIVE_TEMPLATE = """You are a geopolitics & finance analyst doing DEEP ANALYSIS on a flagged article.
 
 ARTICLE METADATA:
 Title: {title}
@@ -150,7 +197,7 @@ Category: {category}
 URL: {url}
 
 SUMMARY/EXCERPT:
-{summary[:1000]}
+{summary}
 {ratings_guidance}
 YOUR TASK:
 Provide a comprehensive analysis covering:
@@ -185,34 +232,89 @@ Be specific, not generic.
 Challenge assumptions.
 Connect non-obvious dots.
 """
+
+def build_deepdive_prompt(article_data: Dict, full_content: str = "") -> str:
+    """
+    Build Sonnet prompt for deep analysis
+    
+    Focuses on:
+    - Key implications (what this really means)
+    - Contrarian angles (what others miss)
+    - Geopolitical context (connections)
+    - Investment/policy angles (actionable insights)
+    """
     
-    return prompt
+    title = article_data.get('title', 'Unknown')
+    source = article_data.get('source', 'Unknown')
+    url = article_data.get('url', 'Unknown')
+    summary = article_data.get('summary', '')
+    category = article_data.get('category', 'other')
+    
+    ratings_guidance = load_dive_ratings()
+
+    return DEEPDIVE_TEMPLATE.format_map({
+        'title': title,
+        'source': source,
+        'category': category,
+        'url': url,
+        'summary': summary[:1000],
+        'ratings_guidance': ratings_guidance,
+    })
+
+SONNET_MODEL = "claude-sonnet-4-5"
 
-def analyze_with_sonnet(prompt: str) -> str:
+# Finished analyses keyed by sha256(model + prompt): re-running the same
+# deep dive costs nothing and returns instantly. Bypass with --no-cache.
+CACHE_DIR = Path.home() / ".openclaw" / "cache" / "deepdive"
+
+def _cache_path(prompt: str) -> Path:
+    key = hashlib.sha256(f"{SONNET_MODEL}\n{prompt}".encode()).hexdigest()
+    return CACHE_DIR / f"{key}.md"
+
+def analyze_with_sonnet(prompt: str, sink: Optional[TextIO] = None, use_cache: bool = True) -> str:
     """
     Send prompt to Sonnet and get analysis
+    Streams text to the console (and to sink, if given) as it arrives
+    Identical prompts are answered from CACHE_DIR unless use_cache is False
     Returns markdown-formatted analysis
     """
-    from anthropic import Anthropic
+    cache_path = _cache_path(prompt)
+    if use_cache:
+        try:
+            analysis = cache_path.read_text()
+        except FileNotFoundError:
+            pass
+        else:
+            print(f"♻️  Cached analysis ({cache_path.name[:12]}…) — $0, use --no-cache to re-run")
+            print("\n" + "="*80)
+            print(analysis)
+            print("="*80 + "\n")
+            if sink is not None:
+                sink.write(analysis)
+            return analysis
     
-    api_key = get_anthropic_api_key()
-    if not api_key:
-        print("❌ Anthropic API key not found")
-        print("   Run: python setup_keys.py")
-        sys.exit(1)
-    
-    client = Anthropic(api_key=api_key)
+    client = get_client()
     
     print("🧠 Analyzing with Sonnet (this may take 30-60 seconds)...")
     
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-5",
+        chunks = []
+        print("\n" + "="*80)
+        with client.messages.stream(
+            model=SONNET_MODEL,
             max_tokens=4096,
             messages=[{"role": "user", "content": prompt}]
-        )
+        ) as stream:
+            for text in stream.text_stream:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+                if sink is not None:
+                    sink.write(text)
+                chunks.append(text)
+            response = stream.get_final_message()
+        print("\n" + "="*80 + "\n")
         
-        analysis = response.content[0].text.strip()
+        analysis = "".join(chunks).strip()
         
         # Report cost
         input_tokens = response.usage.input_tokens
@@ -222,31 +324,40 @@ def analyze_with_sonnet(prompt: str) -> str:
         print(f"✅ Analysis complete")
         print(f"💰 Cost: ${cost:.4f} ({input_tokens:,} in + {output_tokens:,} out tokens)")
         
-        return analysis
-        
     except Exception as e:
         print(f"❌ Sonnet API error: {e}")
         sys.exit(1)
+    
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(analysis)
+    except OSError as e:
+        print(f"⚠️  Could not cache analysis: {e}")
+    
+    return analysis
 
-def save_analysis(article_data: Dict, analysis: str, interests_dir: Path) -> str:
-    """
-    Save analysis to markdown file in interests directory
-    Returns filename
-    """
+# Characters dropped from deep-dive filenames: anything but str.isalnum()
+# characters (\w minus '_', Unicode-aware), space and '-'. One C-level pass.
+_FILENAME_RE = re.compile(r'[^\w \-]|_')
+
+def _clean_title(title: str) -> str:
+    """Filename-safe slug body: alnum, space and '-' only, spaces → '-', max 50 chars."""
+    return _FILENAME_RE.sub('', title).strip().replace(' ', '-')[:50]
+
+def analysis_path(article_data: Dict, interests_dir: Path) -> Path:
+    """Markdown path for an article's deep dive: interests/deep-dive-YYYY-MM-DD-topic.md"""
     interests_dir.mkdir(exist_ok=True)
     
     # Generate filename from title
     today = datetime.now().strftime("%Y-%m-%d")
     title = article_data.get('title', 'article')
-    # Clean title for filename
-    clean_title = "".join(c for c in title if c.isalnum() or c in (' ', '-')).strip()
-    clean_title = clean_title.replace(' ', '-')[:50]  # Max 50 chars
+    clean_title = _clean_title(title)
     
     filename = f"deep-dive-{today}-{clean_title}.md"
-    filepath = interests_dir / filename
-    
-    # Build markdown document
-    content = f"""# Deep Dive: {article_data.get('title')}
+    return interests_dir / filename
+
+def markdown_header(article_data: Dict) -> str:
+    return f"""# Deep Dive: {article_data.get('title')}
 
 **Date:** {datetime.now().strftime("%Y-%m-%d %H:%M")}
 **Source:** {article_data.get('source', 'Unknown')}
@@ -255,26 +366,61 @@ def save_analysis(article_data: Dict, analysis: str, interests_dir: Path) -> str
 
 ---
 
-{analysis}
+"""
+
+MARKDOWN_FOOTER = """
 
 ---
 
 *Generated by Curator Deep Dive*
 *Cost: ~$0.10-0.20 (Sonnet 4 analysis)*
 """
+
+def save_analysis(article_data: Dict, analysis: str, interests_dir: Path) -> str:
+    """
+    Save analysis to markdown file in interests directory
+    Returns filename
+    """
+    filepath = analysis_path(article_data, interests_dir)
     
-    with open(filepath, 'w') as f:
-        f.write(content)
+    # Write the markdown document piecewise; the buffer coalesces the writes
+    with open(filepath, 'w', buffering=65536) as f:
+        f.write(markdown_header(article_data))
+        f.write(analysis)
+        f.write(MARKDOWN_FOOTER)
     
     print(f"💾 Saved to: {filepath}")
     return str(filepath)
 
+def analyze_and_save(prompt: str, article_data: Dict, interests_dir: Path,
+                     use_cache: bool = True) -> str:
+    """
+    Stream the Sonnet analysis straight into its markdown file
+    Written to a .part file and renamed on success, so a failed call leaves nothing behind
+    Returns analysis
+    """
+    filepath = analysis_path(article_data, interests_dir)
+    partial = filepath.with_name(filepath.name + '.part')
+    try:
+        with open(partial, 'w', buffering=65536) as f:
+            f.write(markdown_header(article_data))
+            analysis = analyze_with_sonnet(prompt, sink=f, use_cache=use_cache)
+            f.write(MARKDOWN_FOOTER)
+        partial.replace(filepath)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    
+    print(f"💾 Saved to: {filepath}")
+    return analysis
+
 def main():
     parser = argparse.ArgumentParser(description="Deep dive analysis on flagged articles")
     parser.add_argument('--rank', type=int, help="Article rank from today's briefing (1-20)")
     parser.add_argument('--url', type=str, help="Article URL")
     parser.add_argument('--save-interest', action='store_true', help="Save to interests/ directory")
     parser.add_argument('--telegram', action='store_true', help="Send analysis to Telegram")
+    parser.add_argument('--no-cache', action='store_true', help="Ignore cached analyses and call Sonnet again")
     
     args = parser.parse_args()
     
@@ -307,18 +453,13 @@ def main():
     # Build prompt
     prompt = build_deepdive_prompt(article_data, full_content)
     
-    # Analyze with Sonnet
-    analysis = analyze_with_sonnet(prompt)
-    
-    # Display
-    print("\n" + "="*80)
-    print(analysis)
-    print("="*80 + "\n")
-    
-    # Save if requested
+    # Analyze with Sonnet (streamed to the console, and to disk if saving)
     if args.save_interest:
         interests_dir = Path.home() / ".openclaw" / "workspace" / "interests"
-        filepath = save_analysis(article_data, analysis, interests_dir)
+        analysis = analyze_and_save(prompt, article_data, interests_dir,
+                                    use_cache=not args.no_cache)
+    else:
+        analysis = analyze_with_sonnet(prompt, use_cache=not args.no_cache)
     
     # TODO: Telegram sending if requested
     if args.telegram:
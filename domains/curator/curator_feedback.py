@@ -11,20 +11,43 @@ Usage:
 Non-interactive (for automation):
     python curator_feedback.py like 3 --channel telegram --text "Good article"
     python curator_feedback.py save 5 --text "Read later"
+    python curator_feedback.py --batch feedback.json   # [{"rank": 3, "type": "like", "text": "..."}]
+    python curator_feedback.py --batch feedback.json --deferred   # Message Batches API, half price
 """
 
+import copy
+import fcntl
+import heapq
 import json
+import mmap
 import sys
 import re
 import os
 import threading
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from anthropic import Anthropic
 from dotenv import load_dotenv
 
-sys.path.insert(0, str(Path(__file__).parent))  # sibling import below (signal_store)
-from signal_store import get_session_id, log_feedback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON codec for the data files (preferences, history, caches); orjson parses
+# and encodes them several times faster when installed
+def _json_loads(raw):
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _json_dumps(obj, indent=False):
+    """obj as UTF-8 JSON bytes, 2-space indented if indent."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+sys.path.insert(0, str(Path(__file__).parent))  # sibling imports (signal_store, curator_utils)
 
 # Load environment variables
 load_dotenv()
@@ -39,6 +62,48 @@ _DATA_DIR.mkdir(parents=True, exist_ok=True)
 PREFERENCES_FILE = _DATA_DIR / "curator_preferences.json"
 _FEEDBACK_LOCK = threading.RLock()
 
+# Parsed JSON files, keyed by path -> (mtime_ns, size, obj). Preferences and
+# history grow to multi-MB and are read several times per action; re-parse
+# only when the file on disk changes.
+_JSON_CACHE = {}
+
+def _load_json_cached(path):
+    """json.load(path), re-parsed only when the file's mtime or size changes.
+
+    The returned object is shared with later callers — only mutate it on the
+    way to a write, and call _invalidate_json(path) if that write can't happen.
+    """
+    st = path.stat()
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = _json_loads(raw)
+    _JSON_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+def _invalidate_json(path):
+    _JSON_CACHE.pop(path, None)
+
+# history_file -> (history obj, {(date, rank): hash_id}); rebuilt whenever
+# _load_json_cached hands back a freshly parsed history
+_HISTORY_INDEX = {}
+
+def _load_history(history_file):
+    """Return (history, appearance index) for date-rank lookups in O(1)."""
+    history = _load_json_cached(history_file)
+    cached = _HISTORY_INDEX.get(history_file)
+    if cached is not None and cached[0] is history:
+        return history, cached[1]
+    index = {}
+    for hid, data in history.items():
+        for appearance in data.get('appearances', ()):
+            # First match wins, as with the old linear scan
+            index.setdefault((appearance.get('date'), appearance.get('rank')), hid)
+    _HISTORY_INDEX[history_file] = (history, index)
+    return history, index
+
 def get_anthropic_api_key():
     """Get Anthropic API key from keychain, env, or SSM"""
     try:
@@ -61,11 +126,42 @@ def get_anthropic_api_key():
 
     return None
 
+# Retries the SDK makes on 429s, 5xx and dropped connections before raising; it
+# backs off exponentially with jitter and honours retry-after (default is 2)
+_API_MAX_RETRIES = 4
+
+@lru_cache(maxsize=None)
+def _anthropic_client(api_key):
+    """One Anthropic client per key and process, so repeat calls reuse its connection pool."""
+    from anthropic import Anthropic  # deferred: only model-calling paths pay for the SDK import
+    return Anthropic(api_key=api_key, max_retries=_API_MAX_RETRIES)
+
+def _async_anthropic_client(api_key):
+    """A fresh AsyncAnthropic; not cached, its connections belong to one event loop."""
+    from anthropic import AsyncAnthropic
+    return AsyncAnthropic(api_key=api_key, max_retries=_API_MAX_RETRIES)
+
+# learned_patterns tallies that update_learned_patterns() adds weights to
+_PATTERN_COUNTERS = ('preferred_content_types', 'preferred_themes',
+                     'preferred_sources', 'avoid_patterns')
+
+def _as_counters(patterns):
+    """Wrap the weight tallies in Counter (missing keys count as 0) in place.
+
+    Counter is a dict subclass, so both JSON encoders still write plain objects.
+    """
+    for key in _PATTERN_COUNTERS:
+        tally = patterns.get(key)
+        if not isinstance(tally, Counter):
+            patterns[key] = Counter(tally or {})
+    return patterns
+
 def load_preferences():
     """Load existing preferences or create new structure"""
     if PREFERENCES_FILE.exists():
-        with open(PREFERENCES_FILE, 'r') as f:
-            return json.load(f)
+        prefs = _load_json_cached(PREFERENCES_FILE)
+        _as_counters(prefs.setdefault('learned_patterns', {}))
+        return prefs
     return {
         "version": "1.0",
         "feedback_history": {},
@@ -82,73 +178,131 @@ def load_preferences():
 def save_preferences(prefs):
     """Save preferences atomically so a failed write cannot corrupt feedback."""
     tmp_path = PREFERENCES_FILE.with_suffix('.json.tmp')
-    with open(tmp_path, 'w') as f:
-        json.dump(prefs, f, indent=2)
+    _invalidate_json(PREFERENCES_FILE)
+    with open(tmp_path, 'wb') as f:
+        f.write(_json_dumps(prefs, indent=True))
+        f.flush()
+        os.fsync(f.fileno())  # the whole feedback history lives in this one file
+        # Key the cache on the file we wrote: rename keeps its mtime and size,
+        # while a stat() after the replace could see another writer's file
+        st = os.fstat(f.fileno())
     tmp_path.replace(PREFERENCES_FILE)
+    # prefs is exactly what is now on disk: keep it as the cached parse so the
+    # next action in this process doesn't re-read the whole history
+    _JSON_CACHE[PREFERENCES_FILE] = (st.st_mtime_ns, st.st_size, prefs)
     print(f"💾 Preferences saved to {PREFERENCES_FILE}")
 
+# One curator_output.txt article block, as written by curator_rss_v2.format_output:
+#   #3 [Source] 🏷️  category (method)
+#      ID: abc12            (optional — older outputs have none)
+#      Title
+#      https://link
+#      Published: ...
+#      Scores: 7.5/10 (...)
+# Only the header line is required; the fields below it are looked up inside
+# the block, so an entry with no URL or no Scores line is still kept.
+_ARTICLE_HEADER_RE = re.compile(
+    r'^#(?P<rank>\d+)[ \t]+\[(?P<source>[^\]\n]+)\][^\n]*?🏷️[ \t]+(?P<category>\w+)[^\n]*',
+    re.MULTILINE,
+)
+# Lines that can never be an article title (URL, metadata)
+_SKIP_PREFIXES = ('http', 'Published', 'ID:')
+_ARTICLE_ID_RE = re.compile(r'^[ \t]*ID:[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+_ARTICLE_TITLE_RE = re.compile(
+    r'^[ \t]*(?!' + '|'.join(map(re.escape, _SKIP_PREFIXES)) + r')'
+    r'(?![^\n]*Scores:)(\S[^\n]*?)[ \t]*$',
+    re.MULTILINE,
+)
+_ARTICLE_URL_RE = re.compile(r'^[ \t]*(http[^\n]*?)[ \t]*$', re.MULTILINE)
+_ARTICLE_SCORES_RE = re.compile(r'^[ \t]*([^\n]*Scores:[^\n]*?)[ \t]*$', re.MULTILINE)
+
+def _article_field(pattern, block):
+    m = pattern.search(block)
+    return m.group(1) if m else None
+
 def parse_curator_output():
     """Parse curator_output.txt to extract article details"""
     if not CURATOR_OUTPUT.exists():
         print(f"❌ Error: {CURATOR_OUTPUT} not found. Run curator first.")
         sys.exit(1)
     
-    articles = {}
-    current_article = None
-    
-    with open(CURATOR_OUTPUT, 'r') as f:
-        content = f.read()
-    
-    # Find the articles section
-    lines = content.split('\n')
-    in_articles = False
+    # Map the file and decode only the "TOP N CURATED ARTICLES" section onward;
+    # the run log ahead of it is never copied into Python strings
+    with open(CURATOR_OUTPUT, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return {}
+        try:
+            start = mm.find(b'CURATED ARTICLES')
+            if start < 0:
+                return {}
+            section = mm[start:].decode('utf-8')
+        finally:
+            mm.close()
     
-    for line in lines:
-        # Detect start of articles list
-        if 'TOP 20 CURATED ARTICLES' in line or 'TOP 15 CURATED ARTICLES' in line:
-            in_articles = True
-            continue
-        
-        # Parse article entries
-        if in_articles and line.startswith('#'):
-            # Extract rank and source
-            match = re.match(r'#(\d+)\s+\[([^\]]+)\].*?🏷️\s+(\w+)', line)
-            if match:
-                rank = int(match.group(1))
-                source = match.group(2)
-                category = match.group(3)
-                current_article = rank
-                articles[rank] = {
-                    'rank': rank,
-                    'source': source,
-                    'category': category,
-                    'title': None,
-                    'url': None,
-                    'scores': None,
-                    'hash_id': None
-                }
-        
-        # Extract hash_id
-        elif current_article and line.strip().startswith('ID:'):
-            articles[current_article]['hash_id'] = line.split('ID:')[1].strip()
-        
-        # Extract title (next non-empty line after rank)
-        elif current_article and articles[current_article]['title'] is None:
-            title = line.strip()
-            if title and not title.startswith('http') and not title.startswith('Published') and not title.startswith('ID:'):
-                articles[current_article]['title'] = title
-        
-        # Extract URL
-        elif current_article and line.strip().startswith('http'):
-            articles[current_article]['url'] = line.strip()
-        
-        # Extract scores
-        elif current_article and 'Scores:' in line:
-            articles[current_article]['scores'] = line.strip()
-            current_article = None  # Done with this article
+    articles = {}
+    headers = list(_ARTICLE_HEADER_RE.finditer(section))
+    for m, following in zip(headers, headers[1:] + [None]):
+        block = section[m.end():following.start() if following else len(section)]
+        # The Scores line closes an article; the summary after it is not parsed
+        scores = _ARTICLE_SCORES_RE.search(block)
+        if scores:
+            block = block[:scores.start()]
+        rank = int(m['rank'])
+        articles[rank] = {
+            'rank': rank,
+            'source': m['source'],
+            'category': m['category'],
+            'title': _article_field(_ARTICLE_TITLE_RE, block),
+            'url': _article_field(_ARTICLE_URL_RE, block),
+            'scores': scores.group(1) if scores else None,
+            'hash_id': _article_field(_ARTICLE_ID_RE, block),
+        }
     
     return articles
 
+@contextmanager
+def history_lock(history_file):
+    """Exclusive inter-process lock around a read-modify-write of history_file.
+
+    Taken on a sidecar .lock file: writers replace the JSON by rename, so a
+    lock on the data file itself would not be seen by the next writer.
+    """
+    with open(history_file.with_name(history_file.name + '.lock'), 'a') as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+def mark_bookmarked(hash_id, output_path):
+    """Flag hash_id as bookmarked in curator_history.json.
+
+    The history is shared with curator_rss_v2, curator_server and
+    curator_intelligence, so it stays one JSON object; the rewrite is skipped
+    when nothing changes and otherwise replaces the file atomically.
+    """
+    history_file = REPO_ROOT / "curator_history.json"
+    today = datetime.now().strftime("%Y-%m-%d")
+    if not history_file.exists():
+        return False
+    with _FEEDBACK_LOCK, history_lock(history_file):
+        try:
+            history = _load_json_cached(history_file)
+        except FileNotFoundError:
+            return False
+        item = history.get(hash_id)
+        if item is None:
+            return False
+        update = {'bookmarked': True, 'deep_dive_path': output_path, 'bookmark_date': today}
+        if all(item.get(k) == v for k, v in update.items()):
+            return True
+        _invalidate_json(history_file)
+        item.update(update)
+        _write_atomic(history_file, _json_dumps(history, indent=True))
+    return True
+
 def resolve_article_reference(ref):
     """
     Resolve article reference to hash_id
@@ -169,8 +323,7 @@ def resolve_article_reference(ref):
         print("❌ History file not found. Run curator first to build history.")
         return None, None
     
-    with open(history_file, 'r') as f:
-        history = json.load(f)
+    history, by_date_rank = _load_history(history_file)
     
     hash_id = None
     
@@ -185,13 +338,7 @@ def resolve_article_reference(ref):
             yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
             
             # Find article with matching date and rank
-            for hid, data in history.items():
-                for appearance in data.get('appearances', []):
-                    if appearance['date'] == yesterday and appearance['rank'] == rank:
-                        hash_id = hid
-                        break
-                if hash_id:
-                    break
+            hash_id = by_date_rank.get((yesterday, rank))
         except (ValueError, IndexError):
             pass
     
@@ -203,13 +350,7 @@ def resolve_article_reference(ref):
             try:
                 rank = int(rank_str)
                 # Find article with matching date and rank
-                for hid, data in history.items():
-                    for appearance in data.get('appearances', []):
-                        if appearance['date'] == date_str and appearance['rank'] == rank:
-                            hash_id = hid
-                            break
-                    if hash_id:
-                        break
+                hash_id = by_date_rank.get((date_str, rank))
             except ValueError:
                 pass
     
@@ -227,11 +368,24 @@ def resolve_article_reference(ref):
         print(f"❌ Cache file not found for {hash_id}")
         return None, None
     
-    with open(cache_file, 'r') as f:
-        article_data = json.load(f)
+    article_data = _load_json_cached(cache_file)
     
     return hash_id, article_data
 
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path):
+    """mkdir -p once per process; later calls for the same path are free."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def _write_atomic(path, data):
+    """Write bytes to a sibling .tmp file and rename it over path."""
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
 def generate_scan(hash_id, article_data, initial_interest, dive_focus=None):
     """
     Generate a Scan (article-level analysis) using Sonnet.
@@ -246,10 +400,11 @@ def generate_scan(hash_id, article_data, initial_interest, dive_focus=None):
         print("❌ No Anthropic API key found")
         return None, None, None
 
-    client = Anthropic(api_key=api_key)
+    client = _anthropic_client(api_key)
 
-    today = datetime.now().strftime("%Y-%m-%d")
-    today_utc = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    now = datetime.now(timezone.utc)
+    today = now.astimezone().strftime("%Y-%m-%d")
+    today_utc = now.strftime("%Y-%m-%d")
 
     # Build prompt
     context_parts = [f"Your initial interest: \"{initial_interest}\""]
@@ -302,6 +457,7 @@ Write directly - no preamble."""
         )
         
         content = response.content[0].text
+        sections = _prepare_scan_sections(content)
         
         # Calculate cost
         input_tokens = response.usage.input_tokens
@@ -309,9 +465,8 @@ Write directly - no preamble."""
         cost = (input_tokens * 0.000003) + (output_tokens * 0.000015)
         
         # Create output path
-        slug = re.sub(r'[^a-z0-9]+', '-', article_data['title'].lower())[:50].strip('-')
-        output_dir = REPO_ROOT / "interests" / "2026" / "scans"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        slug = _SLUG_RE.sub('-', article_data['title'].lower())[:50].strip('-')
+        output_dir = _ensure_dir(REPO_ROOT / "interests" / "2026" / "scans")
         
         output_path = output_dir / f"{hash_id}-{slug}.md"
         
@@ -336,25 +491,27 @@ Write directly - no preamble."""
 
 ## Scan Analysis
 
-{content}
+{"".join(sections)}
 
 ---
 
 *Generated by Claude Sonnet • {input_tokens} input + {output_tokens} output tokens • ${cost:.4f}*
 """
         
-        # Save markdown
-        with open(output_path, 'w') as f:
-            f.write(markdown)
-        
-        # Also save HTML version
+        # Also render HTML version
         html = generate_scan_html(
             hash_id, article_data, initial_interest, dive_focus,
-            content, cost, input_tokens, output_tokens
+            sections, cost, input_tokens, output_tokens
         )
-        html_path = str(output_path).replace('.md', '.html')
-        with open(html_path, 'w') as f:
-            f.write(html)
+        
+        # Save both, then the manifest, so regenerate_scans_index() (run by
+        # the caller afterwards) never sees a half-written scan
+        _write_atomic(output_path, markdown.encode('utf-8'))
+        _write_atomic(output_path.with_suffix('.html'), html.encode('utf-8'))
+        try:
+            _record_scan_in_manifest(output_path)
+        except OSError as e:
+            print(f"⚠️  Could not update {SCANS_MANIFEST}: {e}")
         
         return markdown, cost, str(output_path)
         
@@ -362,167 +519,9 @@ Write directly - no preamble."""
         print(f"❌ Error generating scan: {e}")
         return None, None, None
 
-def regenerate_scans_index():
-    """Regenerate scans/index.html after creating a new Scan (formerly regenerate_scans_index)"""
-    from datetime import datetime
-    scans_dir = REPO_ROOT / "interests" / "2026" / "scans"
-
-    if not scans_dir.exists():
-        return
-
-    # ── Collect Scans (article-level analyses) ───────────────────────────────
-    scans = []
-    for md_file in scans_dir.glob("*.md"):
-        with open(md_file, 'r') as f:
-            content = f.read()
-
-        title_match  = re.search(r'^# (.+)$', content, re.MULTILINE)
-        source_match = re.search(r'\*\*Source:\*\* (.+)$', content, re.MULTILINE)
-        date_match   = re.search(r'\*\*Date:\*\* (.+)$', content, re.MULTILINE)
-
-        if title_match and source_match and date_match:
-            title    = title_match.group(1).strip()
-            source   = source_match.group(1).strip()
-            date_str = date_match.group(1).strip()
-            hash_id  = md_file.stem[:5]
-            try:
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            except Exception:
-                date_obj = datetime.now()
-
-            scans.append({
-                'title':   title,
-                'source':  source,
-                'date':    date_obj,
-                'hash_id': hash_id,
-            })
-
-    scans.sort(key=lambda x: x['date'], reverse=True)
-
-    # ── Collect Dives (thread-level analyses) ────────────────────────────────
-    research_dd_dir = REPO_ROOT / "_NewDomains" / "research-intelligence" / "data" / "dives"
-    dives = []
-
-    if research_dd_dir.exists():
-        for md_file in research_dd_dir.glob("*.md"):
-            with open(md_file, 'r') as f:
-                content = f.read()
-
-            title_m    = re.search(r'^#\s+DEEPER DIVE:\s+(.+)$', content, re.MULTILINE)
-            date_m     = re.search(r'Generated:\s*(\d{4}-\d{2}-\d{2})', content)
-            sessions_m = re.search(r'(\d+)\s+sessions?', content)
-            sources_m  = re.search(r'(\d+)\s+sources?', content)
-            cost_m     = re.search(r'Est\.\s*cost:\s*\$([0-9.]+)', content)
-
-            if not (title_m and date_m):
-                continue
-
-            topic    = title_m.group(1).strip()
-            date_str = date_m.group(1).strip()
-            sessions = sessions_m.group(1) if sessions_m else '?'
-            sources  = sources_m.group(1)  if sources_m  else '?'
-            cost     = f'${cost_m.group(1)}' if cost_m else ''
-            stem     = md_file.stem
-
-            try:
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            except Exception:
-                date_obj = datetime.now()
-
-            # Extract first sentence from Revised Framing section
-            excerpt = ''
-            framing_m = re.search(
-                r'##\s+[0-9.]*\s*REVISED FRAMING[^\n]*\n+(.*?)(?=\n##|\Z)',
-                content, re.DOTALL | re.IGNORECASE
-            )
-            if framing_m:
-                raw = framing_m.group(1).strip()
-                # Strip markdown bold/italic markers
-                raw = re.sub(r'\*\*(.+?)\*\*', r'\1', raw)
-                raw = re.sub(r'\*(.+?)\*', r'\1', raw)
-                raw = re.sub(r'^#+\s+', '', raw, flags=re.MULTILINE)
-                # Take first non-empty line
-                for line in raw.splitlines():
-                    line = line.strip()
-                    if line:
-                        excerpt = line[:160] + ('…' if len(line) > 160 else '')
-                        break
-
-            stats_parts = [f'{sessions} sessions', f'{sources} sources']
-            if cost:
-                stats_parts.append(cost)
-            stats = ' · '.join(stats_parts)
-
-            dives.append({
-                'topic':   topic,
-                'stem':    stem,
-                'date':    date_obj,
-                'stats':   stats,
-                'excerpt': excerpt,
-            })
-
-    dives.sort(key=lambda x: x['date'], reverse=True)
-
-    # ── Build rows (new layout: collapsed sections, hover-reveal actions) ────────
-
-    THREAD_LIMIT  = 3
-    ARTICLE_LIMIT = 5
-
-    # Thread rows
-    thread_rows_html = ''
-    for i, dd in enumerate(dives):
-        formatted_date = dd['date'].strftime("%b %-d, %Y")
-        url = f'/research/dive-result/{dd["stem"]}'
-        excerpt_html = f'<span class="row-excerpt">{dd["excerpt"]}</span>' if dd['excerpt'] else ''
-        hidden_cls = ' row-hidden' if i >= THREAD_LIMIT else ''
-        thread_rows_html += f'        <a class="row row-thread{hidden_cls}" href="{url}"><span class="row-badge">Thread</span><span class="row-main"><span class="row-title">{dd["topic"]}</span>{excerpt_html}</span><span class="row-meta">{dd["stats"]}</span><span class="row-date">{formatted_date}</span><span class="row-action">Read &#8594;</span></a>\n'
-
-    thread_more = len(dives) - THREAD_LIMIT
-    thread_toggle_style = ' style="display:none"' if len(dives) <= THREAD_LIMIT else ''
-    thread_footer_html = ''
-    if thread_more > 0:
-        label = f'+ {thread_more} more thread{"s" if thread_more != 1 else ""}'
-        thread_footer_html = f'        <div class="expand-footer" onclick="expandSection(\'section-threads\')">{label}</div>\n'
-
-    # Article rows
-    article_rows_html = ''
-    for i, dive in enumerate(scans):
-        formatted_date = dive['date'].strftime("%b %-d, %Y")
-        url = f'/research/scan/{dive["hash_id"]}'
-        hidden_cls = ' row-hidden' if i >= ARTICLE_LIMIT else ''
-        article_rows_html += f'        <a class="row row-article{hidden_cls}" href="{url}"><span class="row-date-col">{formatted_date}</span><span class="row-source">{dive["source"]}</span><span class="row-title">{dive["title"]}</span><span class="row-action">Read analysis &#8594;</span></a>\n'
-
-    if not article_rows_html:
-        article_rows_html = '        <div class="row-empty">No scans yet. Like or save an article, then click 🔭 Scan!</div>\n'
-
-    article_more = len(scans) - ARTICLE_LIMIT
-    article_toggle_style = ' style="display:none"' if len(scans) <= ARTICLE_LIMIT else ''
-    article_footer_html = ''
-    if article_more > 0:
-        label = f'+ {article_more} more scan{"s" if article_more != 1 else ""}'
-        article_footer_html = f'        <div class="expand-footer" onclick="expandSection(\'section-articles\')">{label}</div>\n'
-
-    # Count line
-    count_parts = []
-    if dives:
-        count_parts.append(f'{len(dives)} dive{"s" if len(dives) != 1 else ""}')
-    count_parts.append(f'{len(scans)} scan{"s" if len(scans) != 1 else ""}')
-    count_label = ' · '.join(count_parts)
-
-    # Deeper Dives section block (only if entries exist)
-    threads_section_html = ''
-    if dives:
-        threads_section_html = f'''    <div class="section" id="section-threads">
-      <div class="section-hdr">
-        <span class="section-name">Dives <span class="section-count">{len(dives)}</span></span>
-        <button class="toggle-btn"{thread_toggle_style} onclick="toggleSection(\'section-threads\', this)">show all</button>
-      </div>
-      <div class="section-body">
-{thread_rows_html}{thread_footer_html}      </div>
-    </div>
-'''
-
-    html = f'''<!DOCTYPE html>
+# Static page shell for scans/index.html, parsed once. The CSS braces are
+# doubled for str.format; fields are filled by regenerate_scans_index().
+_SCANS_INDEX_TEMPLATE = '''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -840,7 +839,7 @@ def regenerate_scans_index():
 {threads_section_html}
     <div class="section" id="section-articles">
       <div class="section-hdr">
-        <span class="section-name">Scans <span class="section-count">{len(scans)}</span></span>
+        <span class="section-name">Scans <span class="section-count">{scan_count}</span></span>
         <button class="toggle-btn"{article_toggle_style} onclick="toggleSection(\'section-articles\', this)">show all</button>
       </div>
       <div class="section-body">
@@ -864,27 +863,334 @@ function expandSection(sectionId) {{
 </body>
 </html>'''
 
+# Header block generate_scan() writes at the top of every scan .md
+_SCAN_HEADER_RE = re.compile(
+    r'^# (?P<title>[^\n]+)\n\n'
+    r'\*\*Source:\*\* (?P<source>[^\n]+)\n'
+    r'\*\*URL:\*\*[^\n]*\n'
+    r'\*\*Date:\*\* (?P<date>[^\n]+)'
+)
+_SCAN_HEAD_CHARS = 2048   # comfortably covers title + source + URL + date
+
+# scan .md path -> (mtime_ns, size, (title, source, date_str) or None)
+_SCAN_HEADER_CACHE = {}
+
+def _scan_header(md_file, st=None):
+    """(title, source, date_str) from a scan's header, or None if it has none.
+
+    Reads only the head of the file; files that don't start with the standard
+    header fall back to searching the whole file. Cached until the file changes.
+    """
+    if st is None:
+        st = md_file.stat()
+    cached = _SCAN_HEADER_CACHE.get(md_file)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    with open(md_file, 'r') as f:
+        head = f.read(_SCAN_HEAD_CHARS)
+        m = _SCAN_HEADER_RE.match(head)
+        if m:
+            header = (m['title'].strip(), m['source'].strip(), m['date'].strip())
+        else:
+            content = head + f.read()
+            title_match  = re.search(r'^# (.+)$', content, re.MULTILINE)
+            source_match = re.search(r'\*\*Source:\*\* (.+)$', content, re.MULTILINE)
+            date_match   = re.search(r'\*\*Date:\*\* (.+)$', content, re.MULTILINE)
+            header = None
+            if title_match and source_match and date_match:
+                header = (title_match.group(1).strip(),
+                          source_match.group(1).strip(),
+                          date_match.group(1).strip())
+
+    _SCAN_HEADER_CACHE[md_file] = (st.st_mtime_ns, st.st_size, header)
+    return header
+
+# scans/index.json — persisted header of every scan .md, keyed by file name:
+#   {"<name>.md": {"mtime_ns": ..., "size": ..., "header": [title, source, date] | null}}
+# Lets index regeneration (in a fresh process) skip opening unchanged files.
+SCANS_MANIFEST = "index.json"
+# scans/.index.stamp — digest of the scan/dive entries index.html was last
+# rendered from; regenerate_scans_index() skips the rewrite when it matches.
+INDEX_STAMP = ".index.stamp"
+# Listed date for a Scan/Dive whose header date will not parse. Fixed, so the
+# entries (and the stamp above) stay the same from one run to the next.
+_UNDATED = datetime(1970, 1, 1)
+# Rows shown per section before "show all"; part of the index stamp
+_SCANS_INDEX_THREAD_LIMIT  = 3
+_SCANS_INDEX_ARTICLE_LIMIT = 5
+# Bump when the row markup built in regenerate_scans_index() changes, so
+# existing index.html files are re-rendered on the next run.
+_SCANS_INDEX_VERSION = 1
+
+def _load_scans_manifest(scans_dir):
+    try:
+        manifest = _json_loads((scans_dir / SCANS_MANIFEST).read_bytes())
+    except (FileNotFoundError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+def _save_scans_manifest(scans_dir, manifest):
+    """Write atomically, like save_preferences."""
+    _write_atomic(scans_dir / SCANS_MANIFEST, _json_dumps(manifest))
+
+def _manifest_entry(md_file, st=None):
+    if st is None:
+        st = md_file.stat()
+    header = _scan_header(md_file, st)
+    return {
+        'mtime_ns': st.st_mtime_ns,
+        'size':     st.st_size,
+        'header':   list(header) if header else None,
+    }
+
+def _record_scan_in_manifest(md_file):
+    """Add/refresh one scan's manifest entry right after it is written."""
+    scans_dir = md_file.parent
+    manifest = _load_scans_manifest(scans_dir)
+    manifest[md_file.name] = _manifest_entry(md_file)
+    _save_scans_manifest(scans_dir, manifest)
+
+def _scan_headers(scans_dir):
+    """
+    [(md_file, (title, source, date_str))] for every scan with a header.
+
+    Files whose name, mtime and size match index.json are served from it;
+    new or edited files are read and the manifest is rewritten. Deleted files
+    drop out because the directory listing is the source of truth.
+    """
+    manifest = _load_scans_manifest(scans_dir)
+    fresh = {}
+    changed = False
+    # scandir: names and cached stat per entry, no Path object per file
+    with os.scandir(scans_dir) as it:
+        for dirent in it:
+            name = dirent.name
+            if not name.endswith('.md') or name.startswith('.'):
+                continue   # same set as glob("*.md")
+            st = dirent.stat()
+            entry = manifest.get(name)
+            if (not isinstance(entry, dict)
+                    or entry.get('mtime_ns') != st.st_mtime_ns
+                    or entry.get('size') != st.st_size):
+                entry = _manifest_entry(Path(dirent.path), st)
+                changed = True
+            fresh[name] = entry
+
+    if changed or len(fresh) != len(manifest):
+        try:
+            _save_scans_manifest(scans_dir, fresh)
+        except OSError as e:
+            print(f"⚠️  Could not update {SCANS_MANIFEST}: {e}")
+
+    return [(scans_dir / name, tuple(entry['header']))
+            for name, entry in fresh.items() if entry['header']]
+
+# Fields of a research-intelligence Dive .md, read for each index row
+_DIVE_TITLE_RE    = re.compile(r'^#\s+DEEPER DIVE:\s+(.+)$', re.MULTILINE)
+_DIVE_DATE_RE     = re.compile(r'Generated:\s*(\d{4}-\d{2}-\d{2})')
+_DIVE_SESSIONS_RE = re.compile(r'(\d+)\s+sessions?')
+_DIVE_SOURCES_RE  = re.compile(r'(\d+)\s+sources?')
+_DIVE_COST_RE     = re.compile(r'Est\.\s*cost:\s*\$([0-9.]+)')
+_DIVE_FRAMING_RE  = re.compile(r'##\s+[0-9.]*\s*REVISED FRAMING[^\n]*\n+(.*?)(?=\n##|\Z)',
+                               re.DOTALL | re.IGNORECASE)
+_MD_ITALIC_RE       = re.compile(r'\*(.+?)\*')
+_MD_HEADING_MARK_RE = re.compile(r'^#+\s+', re.MULTILINE)
+
+def regenerate_scans_index():
+    """Regenerate scans/index.html after creating a new Scan (formerly regenerate_scans_index)"""
+    from datetime import datetime
+    scans_dir = REPO_ROOT / "interests" / "2026" / "scans"
+
+    if not scans_dir.exists():
+        return
+
+    # ── Collect Scans (article-level analyses) ───────────────────────────────
+    scans = []
+    for md_file, header in _scan_headers(scans_dir):
+        if header:
+            title, source, date_str = header
+            hash_id  = md_file.stem[:5]
+            try:
+                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+            except Exception:
+                date_obj = _UNDATED
+
+            scans.append({
+                'title':   title,
+                'source':  source,
+                'date':    date_obj,
+                'hash_id': hash_id,
+            })
+
+    scans.sort(key=lambda x: x['date'], reverse=True)
+
+    # ── Collect Dives (thread-level analyses) ────────────────────────────────
+    research_dd_dir = REPO_ROOT / "_NewDomains" / "research-intelligence" / "data" / "dives"
+    dives = []
+
+    if research_dd_dir.exists():
+        for md_file in research_dd_dir.glob("*.md"):
+            with open(md_file, 'r') as f:
+                content = f.read()
+
+            title_m    = _DIVE_TITLE_RE.search(content)
+            date_m     = _DIVE_DATE_RE.search(content)
+            sessions_m = _DIVE_SESSIONS_RE.search(content)
+            sources_m  = _DIVE_SOURCES_RE.search(content)
+            cost_m     = _DIVE_COST_RE.search(content)
+
+            if not (title_m and date_m):
+                continue
+
+            topic    = title_m.group(1).strip()
+            date_str = date_m.group(1).strip()
+            sessions = sessions_m.group(1) if sessions_m else '?'
+            sources  = sources_m.group(1)  if sources_m  else '?'
+            cost     = f'${cost_m.group(1)}' if cost_m else ''
+            stem     = md_file.stem
+
+            try:
+                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+            except Exception:
+                date_obj = _UNDATED
+
+            # Extract first sentence from Revised Framing section
+            excerpt = ''
+            framing_m = _DIVE_FRAMING_RE.search(content)
+            if framing_m:
+                raw = framing_m.group(1).strip()
+                # Strip markdown bold/italic markers
+                raw = _MD_BOLD_RE.sub(r'\1', raw)
+                raw = _MD_ITALIC_RE.sub(r'\1', raw)
+                raw = _MD_HEADING_MARK_RE.sub('', raw)
+                # Take first non-empty line
+                for line in raw.splitlines():
+                    line = line.strip()
+                    if line:
+                        excerpt = line[:160] + ('…' if len(line) > 160 else '')
+                        break
+
+            stats_parts = [f'{sessions} sessions', f'{sources} sources']
+            if cost:
+                stats_parts.append(cost)
+            stats = ' · '.join(stats_parts)
+
+            dives.append({
+                'topic':   topic,
+                'stem':    stem,
+                'date':    date_obj,
+                'stats':   stats,
+                'excerpt': excerpt,
+            })
+
+    dives.sort(key=lambda x: x['date'], reverse=True)
+
+    # ── Skip the render when nothing the page shows has changed ─────────────
     index_file = scans_dir / "index.html"
-    with open(index_file, 'w') as f:
-        f.write(html)
+    stamp_file = scans_dir / INDEX_STAMP
+    import hashlib
+    digest = hashlib.blake2b(digest_size=16)
+    # Layout inputs are part of the stamp, so a change to the template, the
+    # row markup or the limits re-renders even when no entry changed.
+    digest.update(repr((_SCANS_INDEX_VERSION, _SCANS_INDEX_THREAD_LIMIT,
+                        _SCANS_INDEX_ARTICLE_LIMIT)).encode('utf-8'))
+    digest.update(_SCANS_INDEX_TEMPLATE.encode('utf-8'))
+    digest.update('\n'.join(map(repr, scans + dives)).encode('utf-8'))
+    stamp = digest.hexdigest()
+    try:
+        if index_file.exists() and stamp_file.read_text() == stamp:
+            print(f"📑 Scans & Dives index unchanged ({len(dives)} dives + {len(scans)} scans)")
+            return
+    except OSError:
+        pass
+
+    # ── Build rows (new layout: collapsed sections, hover-reveal actions) ────────
+
+    THREAD_LIMIT  = _SCANS_INDEX_THREAD_LIMIT
+    ARTICLE_LIMIT = _SCANS_INDEX_ARTICLE_LIMIT
+
+    # Thread rows
+    thread_rows = []
+    for i, dd in enumerate(dives):
+        formatted_date = dd['date'].strftime("%b %-d, %Y")
+        url = f'/research/dive-result/{dd["stem"]}'
+        excerpt_html = f'<span class="row-excerpt">{dd["excerpt"]}</span>' if dd['excerpt'] else ''
+        hidden_cls = ' row-hidden' if i >= THREAD_LIMIT else ''
+        thread_rows.append(f'        <a class="row row-thread{hidden_cls}" href="{url}"><span class="row-badge">Thread</span><span class="row-main"><span class="row-title">{dd["topic"]}</span>{excerpt_html}</span><span class="row-meta">{dd["stats"]}</span><span class="row-date">{formatted_date}</span><span class="row-action">Read &#8594;</span></a>\n')
+    thread_rows_html = ''.join(thread_rows)
+
+    thread_more = len(dives) - THREAD_LIMIT
+    thread_toggle_style = ' style="display:none"' if len(dives) <= THREAD_LIMIT else ''
+    thread_footer_html = ''
+    if thread_more > 0:
+        label = f'+ {thread_more} more thread{"s" if thread_more != 1 else ""}'
+        thread_footer_html = f'        <div class="expand-footer" onclick="expandSection(\'section-threads\')">{label}</div>\n'
+
+    # Article rows
+    article_rows = []
+    for i, dive in enumerate(scans):
+        formatted_date = dive['date'].strftime("%b %-d, %Y")
+        url = f'/research/scan/{dive["hash_id"]}'
+        hidden_cls = ' row-hidden' if i >= ARTICLE_LIMIT else ''
+        article_rows.append(f'        <a class="row row-article{hidden_cls}" href="{url}"><span class="row-date-col">{formatted_date}</span><span class="row-source">{dive["source"]}</span><span class="row-title">{dive["title"]}</span><span class="row-action">Read analysis &#8594;</span></a>\n')
+    article_rows_html = ''.join(article_rows)
+
+    if not article_rows_html:
+        article_rows_html = '        <div class="row-empty">No scans yet. Like or save an article, then click 🔭 Scan!</div>\n'
+
+    article_more = len(scans) - ARTICLE_LIMIT
+    article_toggle_style = ' style="display:none"' if len(scans) <= ARTICLE_LIMIT else ''
+    article_footer_html = ''
+    if article_more > 0:
+        label = f'+ {article_more} more scan{"s" if article_more != 1 else ""}'
+        article_footer_html = f'        <div class="expand-footer" onclick="expandSection(\'section-articles\')">{label}</div>\n'
+
+    # Count line
+    count_parts = []
+    if dives:
+        count_parts.append(f'{len(dives)} dive{"s" if len(dives) != 1 else ""}')
+    count_parts.append(f'{len(scans)} scan{"s" if len(scans) != 1 else ""}')
+    count_label = ' · '.join(count_parts)
+
+    # Deeper Dives section block (only if entries exist)
+    threads_section_html = ''
+    if dives:
+        threads_section_html = f'''    <div class="section" id="section-threads">
+      <div class="section-hdr">
+        <span class="section-name">Dives <span class="section-count">{len(dives)}</span></span>
+        <button class="toggle-btn"{thread_toggle_style} onclick="toggleSection(\'section-threads\', this)">show all</button>
+      </div>
+      <div class="section-body">
+{thread_rows_html}{thread_footer_html}      </div>
+    </div>
+'''
+
+    html = _SCANS_INDEX_TEMPLATE.format_map({
+        'count_label':          count_label,
+        'threads_section_html': threads_section_html,
+        'scan_count':           len(scans),
+        'article_toggle_style': article_toggle_style,
+        'article_rows_html':    article_rows_html,
+        'article_footer_html':  article_footer_html,
+    })
+
+    _write_atomic(index_file, html.encode('utf-8'))
+    _write_atomic(stamp_file, stamp.encode('ascii'))
 
     total = len(dives) + len(scans)
     print(f"📑 Scans & Dives index updated ({len(dives)} dives + {len(scans)} scans = {total} total)")
 
-def generate_scan_html(hash_id, article_data, initial_interest, dive_focus, analysis_content, cost, input_tokens, output_tokens):
-    """Generate HTML version of a Scan (formerly generate_deep_dive_html)"""
-    from datetime import datetime
-    
-    today = datetime.now().strftime("%Y-%m-%d")
-    
-    html = f"""<!DOCTYPE html>
+# Static head of a Scan's HTML page (styles, header, metadata, interest box),
+# parsed once; generate_scan_html() appends the analysis body after it.
+_SCAN_HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <link rel="preconnect" href="https://fonts.googleapis.com">
     <link href="https://fonts.googleapis.com/css2?family=Playfair+Display:ital,wght@0,400;0,600;1,400&family=DM+Mono:wght@400;500&family=Source+Sans+3:wght@400;500;600&display=swap" rel="stylesheet">
-    <title>{article_data['title']} - Scan</title>
+    <title>{title} - Scan</title>
     <style>
         :root {{
             --bg: #f5f0e8;
@@ -1107,11 +1413,11 @@ def generate_scan_html(hash_id, article_data, initial_interest, dive_focus, anal
 <div style="padding: 32px;">
     <div class="container">
         
-        <h1>{article_data['title']}</h1>
+        <h1>{title}</h1>
         
         <div class="meta">
-            <strong>Source:</strong> {article_data['source']}<br>
-            <strong>URL:</strong> <a href="{article_data['url']}" target="_blank">{article_data['url']}</a><br>
+            <strong>Source:</strong> {source}<br>
+            <strong>URL:</strong> <a href="{url}" target="_blank">{url}</a><br>
             <strong>Date:</strong> {today}<br>
             <strong>Hash ID:</strong> {hash_id}
         </div>
@@ -1120,62 +1426,118 @@ def generate_scan_html(hash_id, article_data, initial_interest, dive_focus, anal
             <h2>Your Interest</h2>
             <p>{initial_interest}</p>
 """
+
+# Scan markdown → HTML patterns, compiled once
+_SCAN_HEADING_RE  = re.compile(r'^##\s+(Deep Dive|Scan) Analysis\s*\n', re.IGNORECASE | re.MULTILINE)
+_SOURCES_SPLIT_RE = re.compile(r'(^## (?:Sources|Bibliography|Further Reading|References)[^\n]*\n)', re.MULTILINE)
+_MD_BOLD_RE   = re.compile(r'\*\*(.+?)\*\*')
+_HEADING_TEXT_RE = re.compile(r'## (.+)')
+
+# "## ", "### " and "- " line markers -> tag; sources only get list items
+_MD_LINE_TAGS    = (('## ', 'h2'), ('### ', 'h3'), ('- ', 'li'))
+_MD_ITEM_TAGS    = (('- ', 'li'),)
+
+def _md_bold(line):
+    """**x** -> <strong>x</strong> within one line; same matches as _MD_BOLD_RE."""
+    end = line.find('**')
+    if end < 0:
+        return line
+    out = []
+    pos = 0
+    while end >= 0:
+        close = line.find('**', end + 3)   # .+? needs at least one char
+        if close < 0:
+            break
+        out.append(f'{line[pos:end]}<strong>{line[end + 2:close]}</strong>')
+        pos = close + 2
+        end = line.find('**', pos)
+    out.append(line[pos:])
+    return ''.join(out)
+
+def _md_to_html(text, line_tags=_MD_LINE_TAGS):
+    """Headings, **bold** and "- item" lines, then one <ul> around the <li>s.
+
+    Plain string scans per line rather than regex passes over the whole text.
+    """
+    lines = text.split('\n')
+    for n, line in enumerate(lines):
+        for marker, tag in line_tags:
+            if line.startswith(marker) and len(line) > len(marker):
+                lines[n] = f'<{tag}>{_md_bold(line[len(marker):])}</{tag}>'
+                break
+        else:
+            lines[n] = _md_bold(line)
+    html = '\n'.join(lines)
+    first = html.find('<li>')
+    if first >= 0:
+        last = html.rfind('</li>') + len('</li>')
+        if last >= first + len('<li></li>'):
+            html = f'{html[:first]}<ul>{html[first:last]}</ul>{html[last:]}'
+    return html
+
+def _prepare_scan_sections(analysis_content):
+    """
+    Split a Scan's AI output once into (main, sources_heading, sources), shared
+    by the markdown and HTML writers. Drops any "Scan/Deep Dive Analysis"
+    headings the model adds (both templates supply their own).
+    """
+    cleaned = _SCAN_HEADING_RE.sub('', analysis_content)
+    parts = _SOURCES_SPLIT_RE.split(cleaned, maxsplit=1)
+    if len(parts) == 3:
+        return parts[0], parts[1], parts[2]
+    return cleaned, '', ''
+
+def generate_scan_html(hash_id, article_data, initial_interest, dive_focus, analysis_content, cost, input_tokens, output_tokens):
+    """Generate HTML version of a Scan (formerly generate_deep_dive_html)
+
+    analysis_content: raw AI output, or the (main, sources_heading, sources)
+    tuple from _prepare_scan_sections()
+    """
+    from datetime import datetime
+    
+    today = datetime.now().strftime("%Y-%m-%d")
+    
+    parts = [_SCAN_HTML_TEMPLATE.format_map({
+        'title':            article_data['title'],
+        'source':           article_data['source'],
+        'url':              article_data['url'],
+        'today':            today,
+        'hash_id':          hash_id,
+        'initial_interest': initial_interest,
+    })]
     
     if dive_focus:
-        html += f"            <p><strong>Focus:</strong> {dive_focus}</p>\n"
+        parts.append(f"            <p><strong>Focus:</strong> {dive_focus}</p>\n")
     
-    html += """        </div>
+    parts.append("""        </div>
         
         <div class="analysis">
             <h2>Scan Analysis</h2>
-"""
+""")
     
     # Convert markdown analysis to basic HTML
     # Simple conversion: h2, h3, bold, lists
-    
-    # Strip ALL "Deep Dive Analysis" headings from AI output (we add it in template)
-    # Run twice to handle duplicate headings that sometimes appear
-    analysis_content = re.sub(r'^##\s+(Deep Dive|Scan) Analysis\s*\n', '', analysis_content, flags=re.IGNORECASE | re.MULTILINE)
-    analysis_content = re.sub(r'^##\s+(Deep Dive|Scan) Analysis\s*\n', '', analysis_content, flags=re.IGNORECASE | re.MULTILINE)
-    
-    # Check if there's a Sources/Bibliography section
-    has_sources = bool(re.search(r'^## (Sources|Bibliography|Further Reading|References)', analysis_content, flags=re.MULTILINE))
-    
-    if has_sources:
-        # Split at Sources section
-        parts = re.split(r'(^## (?:Sources|Bibliography|Further Reading|References)[^\n]*\n)', analysis_content, maxsplit=1, flags=re.MULTILINE)
-        main_content = parts[0] if len(parts) > 0 else analysis_content
-        sources_heading = parts[1] if len(parts) > 1 else ''
-        sources_content = parts[2] if len(parts) > 2 else ''
-    else:
-        main_content = analysis_content
-        sources_heading = ''
-        sources_content = ''
+    if isinstance(analysis_content, str):
+        analysis_content = _prepare_scan_sections(analysis_content)
+    main_content, sources_heading, sources_content = analysis_content
+    has_sources = bool(sources_heading)
     
     # Convert main content
-    analysis_html = re.sub(r'^## (.+)$', '<h2>\\1</h2>', main_content, flags=re.MULTILINE)
-    analysis_html = re.sub(r'^### (.+)$', '<h3>\\1</h3>', analysis_html, flags=re.MULTILINE)
-    analysis_html = re.sub(r'\*\*(.+?)\*\*', '<strong>\\1</strong>', analysis_html)
-    analysis_html = re.sub(r'^- (.+)$', '<li>\\1</li>', analysis_html, flags=re.MULTILINE)
-    analysis_html = re.sub(r'(<li>.*</li>)', '<ul>\\1</ul>', analysis_html, flags=re.DOTALL)
+    analysis_html = _md_to_html(main_content)
     
     # Paragraphs
     paragraphs = analysis_html.split('\n\n')
-    analysis_html = '\n'.join([f'<p>{p}</p>' if not p.startswith('<') else p for p in paragraphs if p.strip()])
-    
-    html += analysis_html
+    parts.append('\n'.join([f'<p>{p}</p>' if not p.startswith('<') else p for p in paragraphs if p.strip()]))
     
     # Add sources section if present
     if has_sources and sources_content.strip():
-        sources_html = re.sub(r'\*\*(.+?)\*\*', '<strong>\\1</strong>', sources_content)
-        sources_html = re.sub(r'^- (.+)$', '<li>\\1</li>', sources_html, flags=re.MULTILINE)
-        sources_html = re.sub(r'(<li>.*</li>)', '<ul>\\1</ul>', sources_html, flags=re.DOTALL)
+        sources_html = _md_to_html(sources_content, _MD_ITEM_TAGS)
         
         # Extract title from heading
-        sources_title = re.search(r'## (.+)', sources_heading)
+        sources_title = _HEADING_TEXT_RE.search(sources_heading)
         title = sources_title.group(1) if sources_title else 'Sources & Further Reading'
         
-        html += f"""
+        parts.append(f"""
         </div>
         
         <div class="bibliography">
@@ -1184,9 +1546,9 @@ def generate_scan_html(hash_id, article_data, initial_interest, dive_focus, anal
         </div>
         
         <div class="analysis">
-"""
+""")
     
-    html += f"""
+    parts.append(f"""
         </div>
         
         <div class="footer">
@@ -1197,79 +1559,338 @@ def generate_scan_html(hash_id, article_data, initial_interest, dive_focus, anal
 </div>
 </body>
 </html>
-"""
+""")
     
-    return html
+    return ''.join(parts)
+
+# Parsed extract_metadata() results, keyed by sha256(model + system + schema + prompt):
+# the same article + words + feedback type (e.g. a re-submitted web_ui form)
+# reuses the earlier answer instead of another model call. Editing the prompt
+# changes the key, so stale entries are simply never hit.
+METADATA_CACHE_FILE = _DATA_DIR / "metadata_cache.json"
+# Tagging feedback against a fixed schema is a Haiku-sized job; Sonnet is asked
+# again only when Haiku's reply isn't usable metadata
+METADATA_MODEL = os.environ.get("CURATOR_METADATA_MODEL", "claude-haiku-4-5")
+METADATA_FALLBACK_MODEL = os.environ.get("CURATOR_METADATA_FALLBACK_MODEL", "claude-sonnet-4-5")
+_METADATA_FIELDS = frozenset(("content_type", "appeal", "style", "themes", "depth", "signals"))
+
+# Fixed instructions + schema for extract_metadata(), sent as a cacheable system
+# block; only the article/feedback user message varies between calls. Anthropic
+# caches prefixes of 1024+ tokens, so this engages once the schema grows past that.
+_METADATA_SYSTEM = """Analyze the user's feedback about an article and extract structured metadata.
+
+Record it with the record_metadata tool; the field descriptions list the usual values."""
+
+def _tag_list(description):
+    return {"type": "array", "items": {"type": "string"}, "description": description}
+
+_METADATA_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "content_type": _tag_list("content types: argumentative, analytical, descriptive, "
+                                  "statistical, narrative, investigative"),
+        "appeal": _tag_list("what appealed or didn't: evidence_based, institutional_tension, "
+                            "contrarian, depth, clarity, originality"),
+        "style": _tag_list("writing style: challenge_not_summary, data_driven, opinion_based, "
+                           "technical, accessible"),
+        "themes": _tag_list("themes: fiscal_policy, monetary_policy, geopolitics, "
+                            "institutional_debates, market_analysis"),
+        "depth": {"type": "string",
+                  "enum": ["surface_summary", "moderate_analysis", "deep_dive", "original_research"]},
+        "signals": _tag_list("positive signals if liked, negative if disliked"),
+    },
+    "required": sorted(_METADATA_FIELDS),
+}
+
+# Forced tool calls: the reply is the tool input, already a dict, so there is
+# no free-form JSON to strip of code fences or fail to parse
+_METADATA_TOOL = {
+    "name": "record_metadata",
+    "description": "Record the metadata extracted from one feedback item.",
+    "input_schema": _METADATA_SCHEMA,
+}
+_METADATA_BATCH_TOOL = {
+    "name": "record_metadata_batch",
+    "description": "Record the metadata extracted from several feedback items, in order.",
+    "input_schema": {
+        "type": "object",
+        "properties": {"items": {"type": "array", "items": _METADATA_SCHEMA}},
+        "required": ["items"],
+    },
+}
+# The bounded schema needs ~150 output tokens per item
+_METADATA_MAX_TOKENS = 300
+# Items per combined request: 50 * 300 max_tokens stays under the ~21k the SDK
+# allows without streaming
+_METADATA_BATCH_SIZE = 50
+
+# Appended to a multi-feedback message by extract_metadata_batch()
+_METADATA_BATCH_NOTE = (
+    "There are {count} feedback items above. Call record_metadata_batch with "
+    "{count} items, one per feedback item, in the same order."
+)
+
+def _metadata_prompt(article, user_words, feedback_type):
+    return (
+        "Article:\n"
+        f"- Title: {article['title']}\n"
+        f"- Source: {article['source']}\n"
+        f"- Category: {article['category']}\n"
+        "\n"
+        f"User feedback ({feedback_type}):\n"
+        f'"{user_words}"'
+    )
+
+def _metadata_cache_key(prompt):
+    import hashlib  # deferred with the rest of the metadata path
+    key = f"{METADATA_MODEL}\n{_METADATA_SYSTEM}\n{_METADATA_SCHEMA}\n{prompt}"
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+def _valid_metadata(metadata):
+    return isinstance(metadata, dict) and _METADATA_FIELDS <= metadata.keys()
+
+def _load_metadata_cache():
+    try:
+        cache = _load_json_cached(METADATA_CACHE_FILE)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def _store_cached_metadata(entries):
+    """Merge {cache_key: metadata} into the cache file, warning on failure."""
+    try:
+        with _FEEDBACK_LOCK:
+            cache = dict(_load_metadata_cache())
+            cache.update(entries)
+            _invalidate_json(METADATA_CACHE_FILE)
+            _write_atomic(METADATA_CACHE_FILE, _json_dumps(cache))
+    except OSError as e:
+        print(f"⚠️  Could not update {METADATA_CACHE_FILE.name}: {e}")
+
+def _metadata_request(prompt, max_tokens=_METADATA_MAX_TOKENS, tool=_METADATA_TOOL,
+                      model=None):
+    """messages.create() arguments for one prompt under the metadata system block."""
+    return {
+        "model": model or METADATA_MODEL,
+        "max_tokens": max_tokens,
+        "system": [{"type": "text", "text": _METADATA_SYSTEM,
+                    "cache_control": {"type": "ephemeral"}}],
+        "tools": [tool],
+        "tool_choice": {"type": "tool", "name": tool["name"]},
+        "messages": [{"role": "user", "content": prompt}],
+    }
+
+def _metadata_from_message(message):
+    """The metadata tool input from a reply Message (a list for the batch tool); None if absent."""
+    for block in getattr(message, "content", None) or ():
+        if getattr(block, "type", None) == "tool_use":
+            if block.name == _METADATA_BATCH_TOOL["name"]:
+                return block.input.get("items")
+            return block.input
+    print(f"⚠️  Metadata extraction failed: no tool call in the reply "
+          f"(stop_reason {getattr(message, 'stop_reason', None)})")
+    return None
+
+def _ask_metadata_model(api_key, prompt, max_tokens=_METADATA_MAX_TOKENS, tool=_METADATA_TOOL,
+                        model=None):
+    """Send one user message under the metadata system block; returns the tool input."""
+    client = _anthropic_client(api_key)
+    request = _metadata_request(prompt, max_tokens, tool, model)
+    return _metadata_from_message(client.messages.create(**request))
+
+# Metadata requests in flight at once when several are asked concurrently
+_METADATA_CONCURRENCY = 10
+
+def _ask_metadata_concurrently(api_key, prompts):
+    """_ask_metadata_model() for each prompt, up to _METADATA_CONCURRENCY at a time.
+
+    Returns one parsed reply per prompt, in order; a request that raises
+    gives None so the caller can retry it on the synchronous path.
+    """
+    import asyncio  # deferred with the rest of the metadata path
+
+    async def ask_all():
+        limit = asyncio.Semaphore(_METADATA_CONCURRENCY)
+        async with _async_anthropic_client(api_key) as client:
+            async def ask(prompt):
+                async with limit:
+                    message = await client.messages.create(**_metadata_request(prompt))
+                return _metadata_from_message(message)
+            return await asyncio.gather(*map(ask, prompts), return_exceptions=True)
+
+    return [None if isinstance(answer, Exception) else answer
+            for answer in asyncio.run(ask_all())]
+
+# Message Batches polling: first wait and cap, in seconds
+_BATCH_POLL_START = 5
+_BATCH_POLL_MAX = 300
+
+def _ask_metadata_batches(api_key, prompts):
+    """Submit {custom_id: prompt} through the Message Batches API and wait.
+
+    Half the price of messages.create(), but results can take minutes to
+    hours, so this is only used when asked for (--deferred). Returns
+    {custom_id: parsed JSON} for the requests that succeeded.
+    """
+    import time  # deferred with the rest of the --deferred path
+
+    client = _anthropic_client(api_key)
+    batch = client.messages.batches.create(requests=[
+        {"custom_id": custom_id, "params": _metadata_request(prompt)}
+        for custom_id, prompt in prompts.items()
+    ])
+    print(f"📮 Submitted {len(prompts)} request(s) as message batch {batch.id}")
+    
+    delay = _BATCH_POLL_START
+    while batch.processing_status != "ended":
+        time.sleep(delay)
+        delay = min(delay * 2, _BATCH_POLL_MAX)
+        batch = client.messages.batches.retrieve(batch.id)
+    
+    answers = {}
+    for item in client.messages.batches.results(batch.id):
+        if item.result.type != "succeeded":
+            print(f"⚠️  Batch request {item.custom_id} {item.result.type}")
+            continue
+        answers[item.custom_id] = _metadata_from_message(item.result.message)
+    return answers
+
+# Feedback too thin to interpret: one-word reactions, the notes main() and
+# record_feedback_batch() fill in when no text is given, and the Telegram
+# bots' "liked from Telegram"-style reasons
+_TRIVIAL_FEEDBACK = frozenset((
+    "good", "bad", "meh", "ok", "okay", "like", "dislike", "liked", "disliked",
+    "save", "saved", "saved for later",
+))
+_DEFAULT_NOTE_RE = re.compile(r'(?:liked|disliked|saved) (?:via|from) \w+', re.IGNORECASE)
+
+def _is_trivial_feedback(user_words):
+    words = (user_words or '').strip()
+    return (len(words) < 8 or words.lower() in _TRIVIAL_FEEDBACK
+            or _DEFAULT_NOTE_RE.fullmatch(words) is not None)
+
+# Returned when the model can't be asked or its answer can't be used
+_EMPTY_METADATA = {
+    "content_type": [],
+    "appeal": [],
+    "style": [],
+    "themes": [],
+    "depth": "unknown",
+    "signals": []
+}
+
+def _empty_metadata(content_type):
+    metadata = copy.deepcopy(_EMPTY_METADATA)  # record_feedback adds source/url to it
+    metadata["content_type"].append(content_type)
+    return metadata
 
 def extract_metadata(article, user_words, feedback_type):
     """Use Claude to extract metadata from user feedback"""
+    if _is_trivial_feedback(user_words):
+        # Nothing for the model to analyze; same as a web button press
+        return _deterministic_metadata(article)
+    
     api_key = get_anthropic_api_key()
     if not api_key:
         print("⚠️  No Anthropic API key found - skipping metadata extraction")
-        return {
-            "content_type": ["manual_entry"],
-            "appeal": [],
-            "style": [],
-            "themes": [],
-            "depth": "unknown",
-            "signals": []
-        }
+        return _empty_metadata("manual_entry")
     
-    client = Anthropic(api_key=api_key)
+    prompt = _metadata_prompt(article, user_words, feedback_type)
+    cache_key = _metadata_cache_key(prompt)
+    cached = _load_metadata_cache().get(cache_key)
+    if _valid_metadata(cached):
+        return copy.deepcopy(cached)  # record_feedback adds source/url to it
+
+    metadata = None
+    # The fallback model gets a turn whether the first reply was unusable or
+    # the request raised
+    for model in dict.fromkeys((METADATA_MODEL, METADATA_FALLBACK_MODEL)):
+        if model != METADATA_MODEL:
+            print(f"🧠 Asking {model} instead...")
+        try:
+            metadata = _ask_metadata_model(api_key, prompt, model=model)
+        except Exception as e:
+            print(f"⚠️  Metadata request to {model} failed: {e}")
+            continue
+        if _valid_metadata(metadata):
+            break
+    if not _valid_metadata(metadata):
+        # Neither model gave a usable answer: same default as the batch path
+        return _empty_metadata("unknown")
     
-    prompt = f"""Analyze this user feedback about an article and extract structured metadata.
-
-Article:
-- Title: {article['title']}
-- Source: {article['source']}
-- Category: {article['category']}
-
-User feedback ({feedback_type}):
-"{user_words}"
-
-Extract and return ONLY a JSON object with these fields:
-{{
-  "content_type": ["list of content types: argumentative, analytical, descriptive, statistical, narrative, investigative"],
-  "appeal": ["what appealed or didn't: evidence_based, institutional_tension, contrarian, depth, clarity, originality"],
-  "style": ["writing style: challenge_not_summary, data_driven, opinion_based, technical, accessible"],
-  "themes": ["themes: fiscal_policy, monetary_policy, geopolitics, institutional_debates, market_analysis"],
-  "depth": "one of: surface_summary, moderate_analysis, deep_dive, original_research",
-  "signals": ["positive signals if liked, negative if disliked"]
-}}
+    _store_cached_metadata({cache_key: metadata})
+    return metadata
 
-Return ONLY valid JSON, no explanation."""
+def extract_metadata_batch(items, deferred=False):
+    """extract_metadata() for a list of (article, user_words, feedback_type).
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5",
-        max_tokens=500,
-        messages=[{"role": "user", "content": prompt}]
-    )
+    Cached answers are reused and the rest go to the model in combined requests
+    of up to _METADATA_BATCH_SIZE items returning an array, or with deferred as
+    one Message Batches request each. Items whose combined request fails or
+    doesn't line up are asked one request each, concurrently; anything still
+    unanswered falls back to one extract_metadata() call each.
+    """
+    prompts = [_metadata_prompt(*item) for item in items]
+    keys = [_metadata_cache_key(prompt) for prompt in prompts]
+    cache = _load_metadata_cache()
+    results = []
+    for (article, user_words, _), key in zip(items, keys):
+        if _is_trivial_feedback(user_words):
+            results.append(_deterministic_metadata(article))
+        elif _valid_metadata(cache.get(key)):
+            results.append(copy.deepcopy(cache[key]))
+        else:
+            results.append(None)
+    pending = [i for i, metadata in enumerate(results) if metadata is None]
     
-    # Parse JSON from response
-    try:
-        response_text = response.content[0].text.strip()
-        # Handle markdown code blocks if present
-        if response_text.startswith('```'):
-            # Extract JSON from code block
-            response_text = response_text.split('```')[1]
-            if response_text.startswith('json'):
-                response_text = response_text[4:]
-            response_text = response_text.strip()
-        
-        metadata = json.loads(response_text)
-        return metadata
-    except (json.JSONDecodeError, IndexError, AttributeError) as e:
-        # Fallback if parsing fails
-        print(f"⚠️  Metadata extraction failed: {e}")
-        print(f"   Response was: {response.content[0].text[:200] if response.content else 'empty'}")
-        return {
-            "content_type": ["unknown"],
-            "appeal": [],
-            "style": [],
-            "themes": [],
-            "depth": "unknown",
-            "signals": []
-        }
+    api_key = get_anthropic_api_key() if deferred and pending else None
+    if api_key:
+        answers = _ask_metadata_batches(
+            api_key, {f"item-{i}": prompts[i] for i in pending}
+        )
+        answered = [i for i in pending if _valid_metadata(answers.get(f"item-{i}"))]
+        for i in answered:
+            results[i] = answers[f"item-{i}"]
+        if answered:
+            _store_cached_metadata({keys[i]: results[i] for i in answered})
+        pending = [i for i in pending if results[i] is None]
+    
+    api_key = get_anthropic_api_key() if len(pending) > 1 else None
+    if api_key:
+        for start in range(0, len(pending), _METADATA_BATCH_SIZE):
+            chunk = pending[start:start + _METADATA_BATCH_SIZE]
+            message = "\n\n".join(
+                f"Item {n}:\n{prompts[i]}" for n, i in enumerate(chunk, 1)
+            ) + "\n\n" + _METADATA_BATCH_NOTE.format(count=len(chunk))
+            try:
+                batch = _ask_metadata_model(api_key, message,
+                                            max_tokens=_METADATA_MAX_TOKENS * len(chunk),
+                                            tool=_METADATA_BATCH_TOOL)
+            except Exception as e:
+                # Left pending: asked again per item below
+                print(f"⚠️  Combined metadata request failed: {e}")
+                continue
+            if (isinstance(batch, list) and len(batch) == len(chunk)
+                    and all(map(_valid_metadata, batch))):
+                for i, metadata in zip(chunk, batch):
+                    results[i] = metadata
+                _store_cached_metadata({keys[i]: results[i] for i in chunk})
+        pending = [i for i in pending if results[i] is None]
+    
+    if api_key and pending:
+        # The combined reply didn't line up: ask per item, concurrently
+        answers = _ask_metadata_concurrently(api_key, [prompts[i] for i in pending])
+        answered = {i: metadata for i, metadata in zip(pending, answers)
+                    if _valid_metadata(metadata)}
+        for i, metadata in answered.items():
+            results[i] = metadata
+        if answered:
+            _store_cached_metadata({keys[i]: metadata for i, metadata in answered.items()})
+        pending = [i for i in pending if results[i] is None]
+    
+    for i in pending:
+        results[i] = extract_metadata(*items[i])
+    return results
 
 def _deterministic_metadata(article):
     """Metadata available without an LLM call.
@@ -1290,6 +1911,12 @@ def _deterministic_metadata(article):
     }
 
 
+def log_feedback(**kwargs):
+    """Append to the Signal Store (signal_store.log_feedback), imported on first use."""
+    from signal_store import log_feedback as append_signal
+    return append_signal(**kwargs)
+
+
 def record_feedback(
     rank,
     feedback_type,
@@ -1298,6 +1925,7 @@ def record_feedback(
     channel='cli',
     *,
     analyze_metadata=True,
+    metadata=None,
 ):
     """Record feedback and update learned patterns
     
@@ -1307,6 +1935,7 @@ def record_feedback(
         user_words: User's explanation
         article: Article data dict
         channel: Source of feedback (cli, web_ui, telegram)
+        metadata: Already-extracted metadata (see record_feedback_batch)
     """
     if feedback_type not in {"liked", "disliked", "saved"}:
         raise ValueError(f"Unsupported feedback type: {feedback_type}")
@@ -1316,10 +1945,10 @@ def record_feedback(
     if missing:
         raise ValueError(f"Article is missing: {', '.join(missing)}")
 
-    if analyze_metadata:
+    if metadata is None and analyze_metadata:
         print("🧠 Analyzing your feedback...")
         metadata = extract_metadata(article, user_words, feedback_type)
-    else:
+    elif metadata is None:
         metadata = _deterministic_metadata(article)
 
     # Inject source and URL into metadata so update_learned_patterns can track them
@@ -1328,7 +1957,8 @@ def record_feedback(
     if article.get('url'):
         metadata['url'] = article['url']
 
-    today = datetime.now().strftime("%Y-%m-%d")
+    now = datetime.now()  # one clock read: entry date, timestamp and last_updated agree
+    today = now.strftime("%Y-%m-%d")
     article_id = article.get('hash_id') or (
         f"fallback-{article['source'].lower().replace(' ', '-')}-{today}-{rank}"
     )
@@ -1339,7 +1969,7 @@ def record_feedback(
         'title': article['title'],
         'source': article['source'],
         'category': article['category'],
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now.isoformat(),
         'your_words': user_words,
         'extracted_signals': metadata
     }
@@ -1364,9 +1994,14 @@ def record_feedback(
         if existing:
             return {"entry": existing, "duplicate": True}
 
-        day_feedback[feedback_type].append(feedback_entry)
-        update_learned_patterns(prefs, metadata, feedback_type)
-        save_preferences(prefs)
+        try:
+            day_feedback[feedback_type].append(feedback_entry)
+            update_learned_patterns(prefs, metadata, feedback_type, now=now)
+            save_preferences(prefs)
+        except BaseException:
+            # prefs may be the shared cached object; drop the unsaved edits
+            _invalidate_json(PREFERENCES_FILE)
+            raise
 
         # Append the secondary event only after the canonical durable write.
         # A telemetry failure must not turn a successful user action into an
@@ -1396,7 +2031,56 @@ def record_feedback(
         print(f"   Themes: {', '.join(metadata['themes'])}")
     return {"entry": feedback_entry, "duplicate": False}
 
-def update_learned_patterns(prefs, metadata, feedback_type):
+# CLI command -> feedback bucket and the default note when no text is given
+_FEEDBACK_COMMANDS = {
+    'like':    ('liked',    "Liked via {channel}"),
+    'dislike': ('disliked', "Disliked via {channel}"),
+    'save':    ('saved',    "Saved via {channel}"),
+}
+
+def record_feedback_batch(entries, channel='cli', deferred=False):
+    """Record several {rank, type, text} feedbacks with one metadata request.
+
+    type is a CLI command (like, dislike, save). Unknown ranks or types are
+    reported and skipped. deferred sends the metadata requests through the
+    Message Batches API (see extract_metadata_batch). Returns the
+    record_feedback() results in order.
+    """
+    articles = parse_curator_output()
+    jobs = []
+    for entry in entries:
+        command = str(entry.get('type', '')).lower()
+        try:
+            rank = int(entry.get('rank'))
+        except (TypeError, ValueError):
+            rank = entry.get('rank')
+        if command not in _FEEDBACK_COMMANDS:
+            print(f"❌ Unknown feedback type: {entry.get('type')!r} (rank {rank})")
+            continue
+        if rank not in articles:
+            print(f"❌ Article #{rank} not found in curator output")
+            continue
+        feedback_type, default_note = _FEEDBACK_COMMANDS[command]
+        user_words = entry.get('text') or default_note.format(channel=channel)
+        jobs.append((rank, feedback_type, user_words, articles[rank]))
+    
+    if not jobs:
+        return []
+    print(f"🧠 Analyzing {len(jobs)} feedback item(s)...")
+    metadata = extract_metadata_batch(
+        [(article, user_words, feedback_type) for _, feedback_type, user_words, article in jobs],
+        deferred=deferred,
+    )
+    return [
+        record_feedback(rank, feedback_type, user_words, article,
+                        channel=channel, metadata=meta)
+        for (rank, feedback_type, user_words, article), meta in zip(jobs, metadata)
+    ]
+
+_WEIGHT_MAP = {'liked': 2, 'saved': 1, 'disliked': -1}
+_ACTION_KEYS = {'liked': 'like', 'saved': 'save', 'disliked': 'dislike'}
+
+def update_learned_patterns(prefs, metadata, feedback_type, now=None):
     """Update aggregate patterns based on new feedback.
 
     Weights (confirmed 2026-02-26):
@@ -1405,27 +2089,29 @@ def update_learned_patterns(prefs, metadata, feedback_type):
       disliked = -1 (clear negative)
     Save is closer to a bookmark than an endorsement — like is the real curation signal.
     """
-    patterns = prefs['learned_patterns']
-    weight_map = {'liked': 2, 'saved': 1, 'disliked': -1}
-    weight = weight_map.get(feedback_type, 1)
+    patterns = _as_counters(prefs['learned_patterns'])
+    weight = _WEIGHT_MAP.get(feedback_type, 1)
 
     # Update content types
+    content_types = patterns['preferred_content_types']
     for ct in metadata.get('content_type', []):
-        patterns['preferred_content_types'][ct] = patterns['preferred_content_types'].get(ct, 0) + weight
+        content_types[ct] += weight
 
     # Update themes
+    themes = patterns['preferred_themes']
     for theme in metadata.get('themes', []):
-        patterns['preferred_themes'][theme] = patterns['preferred_themes'].get(theme, 0) + weight
+        themes[theme] += weight
 
     # Update sources
     source = metadata.get('source')
     if source:
-        patterns['preferred_sources'][source] = patterns['preferred_sources'].get(source, 0) + weight
+        patterns['preferred_sources'][source] += weight
 
     # Update avoid patterns if disliked (format/quality signals)
     if feedback_type == 'disliked':
+        avoid = patterns['avoid_patterns']
         for signal in metadata.get('signals', []):
-            patterns['avoid_patterns'][signal] = patterns['avoid_patterns'].get(signal, 0) + 1
+            avoid[signal] += 1
 
     # Update content domains and source types from article URL
     url = metadata.get('url', '')
@@ -1434,7 +2120,7 @@ def update_learned_patterns(prefs, metadata, feedback_type):
             from curator_utils import extract_domain, classify_source_type
             domain      = extract_domain(url)
             source_type = classify_source_type(url)
-            action_key  = {'liked': 'like', 'saved': 'save', 'disliked': 'dislike'}.get(feedback_type, 'save')
+            action_key  = _ACTION_KEYS.get(feedback_type, 'save')
             if domain:
                 cd = patterns.setdefault('content_domains', {})
                 cd.setdefault(domain, {'like': 0, 'save': 0, 'dislike': 0})
@@ -1447,7 +2133,7 @@ def update_learned_patterns(prefs, metadata, feedback_type):
             pass
 
     # Update metadata
-    patterns['last_updated'] = datetime.now().isoformat()
+    patterns['last_updated'] = (now or datetime.now()).isoformat()
     patterns['sample_size'] = patterns.get('sample_size', 0) + 1
 
 def show_recent_feedback():
@@ -1461,7 +2147,7 @@ def show_recent_feedback():
     print("\n📊 Recent Feedback Summary\n")
     
     # Show last 3 days
-    dates = sorted(prefs['feedback_history'].keys(), reverse=True)[:3]
+    dates = heapq.nlargest(3, prefs['feedback_history'])
     
     for date in dates:
         day = prefs['feedback_history'][date]
@@ -1496,36 +2182,46 @@ def show_recent_feedback():
         
         if patterns['preferred_content_types']:
             print("   Preferred content:")
-            sorted_types = sorted(patterns['preferred_content_types'].items(), key=lambda x: x[1], reverse=True)[:5]
+            sorted_types = patterns['preferred_content_types'].most_common(5)
             for ct, score in sorted_types:
                 print(f"      {ct}: {score:+d}")
         
         if patterns['preferred_themes']:
             print("\n   Preferred themes:")
-            sorted_themes = sorted(patterns['preferred_themes'].items(), key=lambda x: x[1], reverse=True)[:5]
+            sorted_themes = patterns['preferred_themes'].most_common(5)
             for theme, score in sorted_themes:
                 print(f"      {theme}: {score:+d}")
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python curator_feedback.py <like|dislike|save|show|bookmark> [rank|reference] [--channel <cli|web_ui|telegram>] [--text \"feedback text\"]")
-        sys.exit(1)
+    import argparse  # deferred: only the CLI parses arguments
     
-    command = sys.argv[1].lower()
+    parser = argparse.ArgumentParser(
+        description="Record feedback on curator articles",
+        usage='python curator_feedback.py <like|dislike|save|show|bookmark> [rank|reference] '
+              '[--channel <cli|web_ui|telegram>] [--text "feedback text"]\n'
+              '       python curator_feedback.py --batch FILE [--deferred] [--channel <cli|web_ui|telegram>]',
+    )
+    parser.add_argument('command', type=str.lower, nargs='?', help="like, dislike, save, show or bookmark")
+    parser.add_argument('target', nargs='?', help="Article rank, or reference for bookmark")
+    parser.add_argument('--channel', default='cli', help="Feedback channel (default: cli)")
+    parser.add_argument('--text', help="Feedback text, for non-interactive use")
+    parser.add_argument('--batch', metavar='FILE',
+                        help='JSON list of {"rank", "type", "text"} feedbacks to record together')
+    parser.add_argument('--deferred', action='store_true',
+                        help="With --batch: analyze through the Message Batches API "
+                             "(half price; waits until the batch ends, up to hours)")
+    args = parser.parse_intermixed_args()
     
-    # Parse optional --channel flag
-    channel = 'cli'  # Default
-    if '--channel' in sys.argv:
-        channel_idx = sys.argv.index('--channel')
-        if channel_idx + 1 < len(sys.argv):
-            channel = sys.argv[channel_idx + 1]
+    if args.batch:
+        with open(args.batch) as f:
+            record_feedback_batch(json.load(f), channel=args.channel, deferred=args.deferred)
+        return
+    if args.command is None:
+        parser.error("a command is required")
     
-    # Parse optional --text flag (for non-interactive feedback)
-    feedback_text = None
-    if '--text' in sys.argv:
-        text_idx = sys.argv.index('--text')
-        if text_idx + 1 < len(sys.argv):
-            feedback_text = sys.argv[text_idx + 1]
+    command = args.command
+    channel = args.channel
+    feedback_text = args.text  # non-interactive feedback
     
     if command == 'show':
         show_recent_feedback()
@@ -1533,7 +2229,7 @@ def main():
     
     # Bookmark command uses reference (hash ID, date-rank, or yesterday-N)
     if command == 'bookmark':
-        if len(sys.argv) < 3:
+        if args.target is None:
             print("Error: bookmark requires article reference")
             print("Examples:")
             print("  python curator_feedback.py bookmark 90610")
@@ -1541,7 +2237,7 @@ def main():
             print("  python curator_feedback.py bookmark yesterday-1")
             sys.exit(1)
         
-        ref = sys.argv[2]
+        ref = args.target
         hash_id, article_data = resolve_article_reference(ref)
         
         if not hash_id:
@@ -1613,17 +2309,7 @@ def main():
             print(f"   💰 Cost: ${cost:.4f}")
             
             # Update history with bookmark flag
-            history_file = REPO_ROOT / "curator_history.json"
-            with open(history_file, 'r') as f:
-                history = json.load(f)
-            
-            if hash_id in history:
-                history[hash_id]['bookmarked'] = True
-                history[hash_id]['deep_dive_path'] = output_path
-                history[hash_id]['bookmark_date'] = datetime.now().strftime("%Y-%m-%d")
-                
-                with open(history_file, 'w') as f:
-                    json.dump(history, f, indent=2)
+            mark_bookmarked(hash_id, output_path)
             
             # Regenerate scans index
             regenerate_scans_index()
@@ -1633,15 +2319,15 @@ def main():
         return
     
     # Standard commands (like, dislike, save) use rank
-    if len(sys.argv) < 3:
+    if args.target is None:
         print(f"Error: {command} requires article rank number")
         print("Example: python curator_feedback.py like 3")
         sys.exit(1)
     
     try:
-        rank = int(sys.argv[2])
+        rank = int(args.target)
     except ValueError:
-        print(f"Error: '{sys.argv[2]}' is not a valid rank number")
+        print(f"Error: '{args.target}' is not a valid rank number")
         sys.exit(1)
     
     # Parse articles
@@ -87,23 +87,27 @@ _DATA_DIR.mkdir(parents=True, exist_ok=True)
 # ---------------------------------------------------------------------------
 # Cost logger — persists per-run API costs for cost_report.py
 # ---------------------------------------------------------------------------
-_COST_LOG = REPO_ROOT / 'curator_costs.json'
+# One JSON record per line. Append-only: each run is a single O_APPEND write,
+# never a read-modify-write of the whole history. Converted from the old
+# {"runs": [...]} curator_costs.json by scripts/migrate_curator_costs_jsonl.py.
+_COST_LOG = REPO_ROOT / 'curator_costs.jsonl'
 
 def log_curator_cost(model: str, use_type: str, input_tokens: int, output_tokens: int, cost_usd: float):
     """Append one cost record to the curator cost log."""
     try:
         _COST_LOG.parent.mkdir(parents=True, exist_ok=True)
-        data = json.loads(_COST_LOG.read_text()) if _COST_LOG.exists() else {"runs": []}
-        data["runs"].append({
-            "date":          datetime.now(timezone.utc).strftime('%Y-%m-%d'),
-            "timestamp":     datetime.now(timezone.utc).isoformat(),
+        now = datetime.now(timezone.utc)
+        record = {
+            "date":          now.strftime('%Y-%m-%d'),
+            "timestamp":     now.isoformat(),
             "model":         model,
             "use_type":      use_type,
             "input_tokens":  input_tokens,
             "output_tokens": output_tokens,
             "cost_usd":      round(cost_usd, 6),
-        })
-        _COST_LOG.write_text(json.dumps(data, indent=2))
+        }
+        with open(_COST_LOG, 'ab') as f:
+            f.write(json.dumps(record).encode() + b'\n')
     except Exception as e:
         print(f"   [cost_log] Warning: could not write cost record: {e}")
 
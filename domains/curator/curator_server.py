@@ -14,6 +14,7 @@ import json
 import os
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 import re
@@ -59,6 +60,49 @@ def _init_sentry():
 _init_sentry()
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Data-file reads
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Same JSON codec and preferences lock as curator_feedback, which writes these
+# files too. Package-qualified so the server and its tests share one module.
+sys.path.insert(0, str(REPO_ROOT))
+from domains.curator.curator_feedback import _FEEDBACK_LOCK, _json_dumps, _json_loads
+
+def _write_json_atomic(path, obj):
+    """Replace path with obj as indented JSON; a crash leaves the old file intact.
+
+    The temp file gets a unique name, so concurrent writers (or
+    curator_feedback.save_preferences' fixed .json.tmp) never share one.
+    """
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name + '.',
+                                     suffix='.tmp', delete=False) as f:
+        try:
+            f.write(_json_dumps(obj, indent=True))
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, path)
+
+_JSON_CACHE = {}  # path -> (st_mtime_ns, st_size, parsed)
+
+def _read_json_cached(path):
+    """Parsed JSON at path, re-read only when the file's mtime or size changes.
+
+    The same object is returned to every caller until then, so treat it as
+    read-only; routes that modify a file load their own copy.
+    """
+    st = path.stat()
+    cached = _JSON_CACHE.get(path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    data = _json_loads(path.read_bytes())
+    _JSON_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Briefing helpers
 # ─────────────────────────────────────────────────────────────────────────────
@@ -319,7 +363,7 @@ def api_library():
     workspace = _DATA_DIR
     prefs_path = workspace / 'curator_preferences.json'
     if prefs_path.exists():
-        prefs = json.loads(prefs_path.read_text())
+        prefs = _read_json_cached(prefs_path)
         feedback_history = prefs.get('feedback_history', {})
 
         for date_str, day_data in feedback_history.items():
@@ -364,7 +408,7 @@ def api_library():
     # ── 2. Load bookmarked from curator_history.json + enrich existing ────────
     history_path = workspace / 'curator_history.json'
     if history_path.exists():
-        history = json.loads(history_path.read_text())
+        history = _read_json_cached(history_path)
 
         for hash_id, item in history.items():
             url = item.get('url', '')
@@ -516,9 +560,10 @@ def _api_add_priority_legacy():
     new_id = f"p_{max_num + 1:03d}"
     
     # Calculate expiry
+    now = datetime.now()
     expires_at = None
     if expires_days:
-        expiry_date = datetime.now() + timedelta(days=int(expires_days))
+        expiry_date = now + timedelta(days=int(expires_days))
         expires_at = expiry_date.isoformat() + 'Z'
     
     # Create priority
@@ -527,7 +572,7 @@ def _api_add_priority_legacy():
         'label': label,
         'keywords': keywords,
         'boost': float(boost),
-        'created_at': datetime.now().isoformat() + 'Z',
+        'created_at': now.isoformat() + 'Z',
         'expires_at': expires_at,
         'active': True,
         'match_count': 0
@@ -791,41 +836,43 @@ def api_priority_feed_save():
     if not (url and title and source):
         return jsonify({'success': False, 'message': 'Missing url, title, or source'}), 400
 
-    prefs_path = _DATA_DIR / 'curator_preferences.json'
-    if prefs_path.exists():
-        prefs = json.loads(prefs_path.read_text())
-    else:
-        prefs = {'version': '1.0', 'feedback_history': {}}
-
-    feedback_history = prefs.setdefault('feedback_history', {})
-
-    # Idempotency check — scan all dates for matching URL
-    for day_data in feedback_history.values():
-        for entry in day_data.get('saved', []):
-            if entry.get('url') == url:
-                return jsonify({'success': True, 'already_saved': True})
-
-    # Build article_id from priority_id + url hash
-    url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-    article_id = f'priority-{priority_id}-{url_hash}' if priority_id else f'priority-feed-{url_hash}'
-
-    today = datetime.now().strftime('%Y-%m-%d')
-    day_bucket = feedback_history.setdefault(today, {'liked': [], 'saved': []})
-    day_bucket.setdefault('saved', []).append({
-        'article_id':     article_id,
-        'url':            url,
-        'title':          title,
-        'source':         source,
-        'score':          float(score) if score is not None else None,
-        'category':       'priority_feed',
-        'timestamp':      datetime.now().isoformat(),
-        'your_words':     '',
-        'saved_from':     'priority_feed',
-        'priority_id':    priority_id,
-        'priority_label': priority_label,
-    })
+    with _FEEDBACK_LOCK:  # shared with record_feedback in this process
+        prefs_path = _DATA_DIR / 'curator_preferences.json'
+        if prefs_path.exists():
+            prefs = _json_loads(prefs_path.read_bytes())
+        else:
+            prefs = {'version': '1.0', 'feedback_history': {}}
+
+        feedback_history = prefs.setdefault('feedback_history', {})
+
+        # Idempotency check — scan all dates for matching URL
+        for day_data in feedback_history.values():
+            for entry in day_data.get('saved', []):
+                if entry.get('url') == url:
+                    return jsonify({'success': True, 'already_saved': True})
+
+        # Build article_id from priority_id + url hash
+        url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+        article_id = f'priority-{priority_id}-{url_hash}' if priority_id else f'priority-feed-{url_hash}'
+
+        now = datetime.now()  # one clock read: the day bucket and timestamp agree
+        today = now.strftime('%Y-%m-%d')
+        day_bucket = feedback_history.setdefault(today, {'liked': [], 'saved': []})
+        day_bucket.setdefault('saved', []).append({
+            'article_id':     article_id,
+            'url':            url,
+            'title':          title,
+            'source':         source,
+            'score':          float(score) if score is not None else None,
+            'category':       'priority_feed',
+            'timestamp':      now.isoformat(),
+            'your_words':     '',
+            'saved_from':     'priority_feed',
+            'priority_id':    priority_id,
+            'priority_label': priority_label,
+        })
 
-    prefs_path.write_text(json.dumps(prefs, indent=2))
+        _write_json_atomic(prefs_path, prefs)
     print(f'🔖 Priority feed save: [{priority_id}] {title[:60]}')
     return jsonify({'success': True, 'already_saved': False})
 
@@ -852,41 +899,43 @@ def api_priority_feed_feedback():
     # Map action → storage key
     storage_key = {'like': 'liked', 'dislike': 'disliked', 'save': 'saved'}[action]
 
-    prefs_path = _DATA_DIR / 'curator_preferences.json'
-    if prefs_path.exists():
-        prefs = json.loads(prefs_path.read_text())
-    else:
-        prefs = {'version': '1.0', 'feedback_history': {}}
-
-    feedback_history = prefs.setdefault('feedback_history', {})
-
-    # Idempotency — scan all dates for matching URL in this action's bucket
-    for day_data in feedback_history.values():
-        for entry in day_data.get(storage_key, []):
-            if entry.get('url') == url:
-                return jsonify({'success': True, 'already_saved': True, 'action': action})
-
-    # Build entry
-    url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-    article_id = f'priority-{priority_id}-{url_hash}' if priority_id else f'priority-feed-{url_hash}'
-
-    today = datetime.now().strftime('%Y-%m-%d')
-    day_bucket = feedback_history.setdefault(today, {'liked': [], 'saved': []})
-    day_bucket.setdefault(storage_key, []).append({
-        'article_id':     article_id,
-        'url':            url,
-        'title':          title,
-        'source':         source,
-        'score':          float(score) if score is not None else None,
-        'category':       'priority_feed',
-        'timestamp':      datetime.now().isoformat(),
-        'your_words':     '',
-        'saved_from':     'priority_feed',
-        'priority_id':    priority_id,
-        'priority_label': priority_label,
-    })
+    with _FEEDBACK_LOCK:  # shared with record_feedback in this process
+        prefs_path = _DATA_DIR / 'curator_preferences.json'
+        if prefs_path.exists():
+            prefs = _json_loads(prefs_path.read_bytes())
+        else:
+            prefs = {'version': '1.0', 'feedback_history': {}}
+
+        feedback_history = prefs.setdefault('feedback_history', {})
+
+        # Idempotency — scan all dates for matching URL in this action's bucket
+        for day_data in feedback_history.values():
+            for entry in day_data.get(storage_key, []):
+                if entry.get('url') == url:
+                    return jsonify({'success': True, 'already_saved': True, 'action': action})
+
+        # Build entry
+        url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+        article_id = f'priority-{priority_id}-{url_hash}' if priority_id else f'priority-feed-{url_hash}'
+
+        now = datetime.now()  # one clock read: the day bucket and timestamp agree
+        today = now.strftime('%Y-%m-%d')
+        day_bucket = feedback_history.setdefault(today, {'liked': [], 'saved': []})
+        day_bucket.setdefault(storage_key, []).append({
+            'article_id':     article_id,
+            'url':            url,
+            'title':          title,
+            'source':         source,
+            'score':          float(score) if score is not None else None,
+            'category':       'priority_feed',
+            'timestamp':      now.isoformat(),
+            'your_words':     '',
+            'saved_from':     'priority_feed',
+            'priority_id':    priority_id,
+            'priority_label': priority_label,
+        })
 
-    prefs_path.write_text(json.dumps(prefs, indent=2))
+        _write_json_atomic(prefs_path, prefs)
     icons = {'like': '👍', 'dislike': '👎', 'save': '🔖'}
     print(f'{icons[action]} Priority feed {action}: [{priority_id}] {title[:60]}')
     return jsonify({'success': True, 'already_saved': False, 'action': action})
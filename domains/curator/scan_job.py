@@ -11,7 +11,7 @@ REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from domains.curator.curator_feedback import generate_scan, regenerate_scans_index
+from domains.curator.curator_feedback import generate_scan, history_lock, regenerate_scans_index
 
 
 def _update_history(hash_id: str, article: dict, output_path: str) -> None:
@@ -21,17 +21,18 @@ def _update_history(hash_id: str, article: dict, output_path: str) -> None:
         return
 
     try:
-        history = json.loads(history_path.read_text())
-        item = history.setdefault(hash_id, {})
-        for key in ("title", "url", "source", "category"):
-            if article.get(key):
-                item.setdefault(key, article[key])
-        item["bookmarked"] = True
-        item["deep_dive_path"] = output_path
+        with history_lock(history_path):
+            history = json.loads(history_path.read_text())
+            item = history.setdefault(hash_id, {})
+            for key in ("title", "url", "source", "category"):
+                if article.get(key):
+                    item.setdefault(key, article[key])
+            item["bookmarked"] = True
+            item["deep_dive_path"] = output_path
 
-        tmp_path = history_path.with_suffix(".json.tmp")
-        tmp_path.write_text(json.dumps(history, indent=2))
-        tmp_path.replace(history_path)
+            tmp_path = history_path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(history, indent=2))
+            tmp_path.replace(history_path)
     except Exception as exc:
         print(f"History compatibility update skipped: {exc}", file=sys.stderr)
 
@@ -6,6 +6,7 @@ Usage: python blur_screenshots.py
 Output: docs/screenshots/*.png
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image, ImageFilter
 from pathlib import Path
 
@@ -15,12 +16,43 @@ OUTPUT.mkdir(parents=True, exist_ok=True)
 
 BLUR_RADIUS = 20
 
+def separable_blur(region, radius=BLUR_RADIUS):
+    """Gaussian blur as two 1D passes — horizontal, then vertical."""
+    region = region.filter(ImageFilter.GaussianBlur((radius, 0)))
+    return region.filter(ImageFilter.GaussianBlur((0, radius)))
+
+def pixelate(region, block=BLUR_RADIUS):
+    """Mosaic a region: box-downsample by `block`, then nearest-upsample.
+
+    One pass per pixel regardless of block size, and unlike a Gaussian the
+    original text can't be recovered from the result.
+    """
+    rw, rh = region.size
+    small = region.resize((max(1, rw // block), max(1, rh // block)), Image.BOX)
+    return small.resize((rw, rh), Image.NEAREST)
+
+def open_fast(path):
+    """Open and fully decode a screenshot in one pass.
+
+    draft() at the native size asks libjpeg for a single-pass RGB decode
+    (a no-op for non-JPEG inputs); load() then decodes once up front so the
+    crop/paste calls below never trigger a lazy re-read.
+    """
+    img = Image.open(path)
+    img.draft("RGB", img.size)
+    img.load()
+    return img
+
+def save_fast(img, path):
+    """Save as PNG with light zlib compression — max compression dominates save time."""
+    img.save(path, optimize=False, compress_level=1)
+
 def blur_box(img, left_pct, top_pct, right_pct, bottom_pct, radius=BLUR_RADIUS):
-    """Blur a region defined as percentage of image dimensions."""
+    """Redact a region defined as percentage of image dimensions."""
     w, h = img.size
     box = (int(w * left_pct), int(h * top_pct), int(w * right_pct), int(h * bottom_pct))
     region = img.crop(box)
-    blurred = region.filter(ImageFilter.GaussianBlur(radius))
+    blurred = separable_blur(pixelate(region, radius), 2)   # light soften of block edges
     img.paste(blurred, box)
     return img
 
@@ -29,68 +61,85 @@ def blur_box(img, left_pct, top_pct, right_pct, bottom_pct, radius=BLUR_RADIUS):
 # Columns: #, CATEGORY, SOURCE, TITLE, TIME, SCORE, ACTIONS
 # Blur: SOURCE (~19–35%) and TITLE (~35–73%)
 # Keep: #, CATEGORY, TIME, SCORE, ACTIONS, nav bar, column headers
-img = Image.open(INPUT / "Screenshot - Morning Briefing.jpg")
-w, h = img.size
-print(f"Morning Briefing: {w}x{h}")
+def process_morning():
+    img = open_fast(INPUT / "Screenshot - Morning Briefing.jpg")
+    w, h = img.size
+    print(f"Morning Briefing: {w}x{h}")
 
-HEADER_BOTTOM = 0.115   # keep nav + column header row
+    HEADER_BOTTOM = 0.115   # keep nav + column header row
 
-blur_box(img, 0.135, HEADER_BOTTOM, 0.35,  1.0)   # SOURCE (starts at ~13.5%)
-blur_box(img, 0.35,  HEADER_BOTTOM, 0.735, 1.0)   # TITLE
+    blur_box(img, 0.135, HEADER_BOTTOM, 0.35,  1.0)   # SOURCE (starts at ~13.5%)
+    blur_box(img, 0.35,  HEADER_BOTTOM, 0.735, 1.0)   # TITLE
 
-img.save(OUTPUT / "morning-briefing.png")
-print("  → morning-briefing.png")
+    save_fast(img, OUTPUT / "morning-briefing.png")
+    print("  → morning-briefing.png")
 
 
 # ── 2. Reading Library ────────────────────────────────────────────────────────
 # Columns: DATE, TITLE & NOTE, SOURCE, CATEGORY, SCORE, TYPE, ACTIONS
 # Blur: TITLE & NOTE (~9–61%), SOURCE (~61–79%)
 # Keep: DATE, CATEGORY, SCORE, TYPE, ACTIONS, nav, stats, filter buttons
-img = Image.open(INPUT / "Screenshot - Reading Library.jpg")
-w, h = img.size
-print(f"Reading Library: {w}x{h}")
+def process_reading():
+    img = open_fast(INPUT / "Screenshot - Reading Library.jpg")
+    w, h = img.size
+    print(f"Reading Library: {w}x{h}")
 
-HEADER_BOTTOM = 0.365   # keep nav, "Your reading library", stats, filters, column headers
+    HEADER_BOTTOM = 0.365   # keep nav, "Your reading library", stats, filters, column headers
 
-blur_box(img, 0.09,  HEADER_BOTTOM, 0.61,  1.0)   # TITLE & NOTE
-blur_box(img, 0.61,  HEADER_BOTTOM, 0.785, 1.0)   # SOURCE
+    blur_box(img, 0.09,  HEADER_BOTTOM, 0.61,  1.0)   # TITLE & NOTE
+    blur_box(img, 0.61,  HEADER_BOTTOM, 0.785, 1.0)   # SOURCE
 
-img.save(OUTPUT / "reading-library.png")
-print("  → reading-library.png")
+    save_fast(img, OUTPUT / "reading-library.png")
+    print("  → reading-library.png")
 
 
 # ── 3. Deep Dives ─────────────────────────────────────────────────────────────
 # Columns: DATE, SOURCE, TITLE, ACTION
 # Blur: SOURCE column only (~15.5–30%)
 # Keep: DATE, TITLE, "Read Analysis →" buttons, nav, heading
-img = Image.open(INPUT / "Screenshot - Deepdives.jpg")
-w, h = img.size
-print(f"Deep Dives: {w}x{h}")
+def process_deep():
+    img = open_fast(INPUT / "Screenshot - Deepdives.jpg")
+    w, h = img.size
+    print(f"Deep Dives: {w}x{h}")
 
-HEADER_BOTTOM = 0.24   # keep nav, "Deep Dive Archive", "15 deep dives", column headers
+    HEADER_BOTTOM = 0.24   # keep nav, "Deep Dive Archive", "15 deep dives", column headers
 
-blur_box(img, 0.155, HEADER_BOTTOM, 0.275, 1.0)   # SOURCE
+    blur_box(img, 0.155, HEADER_BOTTOM, 0.275, 1.0)   # SOURCE
 
-img.save(OUTPUT / "deep-dives.png")
-print("  → deep-dives.png")
+    save_fast(img, OUTPUT / "deep-dives.png")
+    print("  → deep-dives.png")
 
 
 # ── 4. Priorities ─────────────────────────────────────────────────────────────
 # Two priority cards, each with keyword tag rows to blur
 # Blur: tags under "Tigray Conflict" and tags under "Iran Attack"
 # Keep: topic names, +2.0x badges, ACTIVE badges, Matches/Created/Expires, action buttons
-img = Image.open(INPUT / "Screenshot - Priorities.jpg")
-w, h = img.size
-print(f"Priorities: {w}x{h}")
+def process_priorities():
+    img = open_fast(INPUT / "Screenshot - Priorities.jpg")
+    w, h = img.size
+    print(f"Priorities: {w}x{h}")
+
+    # Tigray Conflict keyword tags (Tigray, Ethiopia, TPLF)
+    blur_box(img, 0.22, 0.555, 0.52, 0.625)
+
+    # Iran Attack keyword tags (missiles, israel, regime change, oil, people of iran)
+    blur_box(img, 0.22, 0.815, 0.79, 0.885)
+
+    save_fast(img, OUTPUT / "priorities.png")
+    print("  → priorities.png")
+
+
+JOBS = [process_morning, process_reading, process_deep, process_priorities]
 
-# Tigray Conflict keyword tags (Tigray, Ethiopia, TPLF)
-blur_box(img, 0.22, 0.555, 0.52, 0.625)
 
-# Iran Attack keyword tags (missiles, israel, regime change, oil, people of iran)
-blur_box(img, 0.22, 0.815, 0.79, 0.885)
+def _run(job):
+    # Top-level so ProcessPoolExecutor can pickle it (lambdas can't be)
+    job()
 
-img.save(OUTPUT / "priorities.png")
-print("  → priorities.png")
 
+if __name__ == "__main__":
+    # The four screenshots are independent — decode/redact/encode them in parallel
+    with ProcessPoolExecutor(max_workers=len(JOBS)) as ex:
+        list(ex.map(_run, JOBS))
 
-print("\nAll done → docs/screenshots/")
+    print("\nAll done → docs/screenshots/")
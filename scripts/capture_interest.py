@@ -21,7 +21,17 @@ from datetime import datetime
 import re
 
 INTERESTS_DIR = Path(__file__).parent.parent / "interests"
-VALID_TAGS = ["DEEP-DIVE", "THIS-WEEK", "BACKLOG", "MUTE"]
+
+# Section header for each tag, in display order
+SECTION_MARKERS = {
+    "DEEP-DIVE": "## 🔥 Deep Dives",
+    "THIS-WEEK": "## 📌 This Week's Focus",
+    "BACKLOG": "## 📚 Backlog",
+    "MUTE": "## 🔇 Mute"
+}
+VALID_TAGS = frozenset(SECTION_MARKERS)
+
+_TAG_RE = re.compile(r'\[([A-Z-]+)\]\s*(.*)')
 
 def parse_input(text: str) -> tuple:
     """
@@ -32,7 +42,7 @@ def parse_input(text: str) -> tuple:
         "China gold" → ("THIS-WEEK", "China gold")  # default tag
     """
     # Try to extract tag
-    match = re.match(r'\[([A-Z-]+)\]\s*(.*)', text)
+    match = _TAG_RE.match(text)
     
     if match:
         tag = match.group(1)
@@ -44,9 +54,9 @@ def parse_input(text: str) -> tuple:
     # Default to THIS-WEEK if no valid tag found
     return ("THIS-WEEK", text.strip())
 
-def get_today_file() -> Path:
+def get_today_file(now: datetime = None) -> Path:
     """Get path to today's interest file"""
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = (now or datetime.now()).strftime("%Y-%m-%d")
     filepath = INTERESTS_DIR / f"{today}-thoughts.md"
     
     # Create directory if needed
@@ -83,56 +93,50 @@ def get_today_file() -> Path:
     
     return filepath
 
-def append_to_section(filepath: Path, tag: str, content: str):
-    """Append content to appropriate section"""
+def append_to_section(filepath: Path, tag: str, content: str, timestamp: str = None):
+    """Append content to appropriate section
     
-    # Read file
-    text = filepath.read_text()
+    Only the bytes from the insertion point onward are written: an entry
+    that lands at end of file is a plain O_APPEND write, and one that lands
+    mid-file rewrites just the sections after it, never the prefix.
+    """
     
-    # Find section based on tag
-    section_markers = {
-        "DEEP-DIVE": "## 🔥 Deep Dives",
-        "THIS-WEEK": "## 📌 This Week's Focus",
-        "BACKLOG": "## 📚 Backlog",
-        "MUTE": "## 🔇 Mute"
-    }
+    # Read file (bytes, so find() positions are file offsets)
+    data = filepath.read_bytes()
     
-    marker = section_markers[tag]
+    # Find section based on tag
+    marker = SECTION_MARKERS[tag]
     
     # Find insertion point (after section header, before next section or end)
-    lines = text.split('\n')
-    section_idx = None
-    
-    for i, line in enumerate(lines):
-        if marker in line:
-            section_idx = i
-            break
+    section_pos = data.find(marker.encode())
     
-    if section_idx is None:
+    if section_pos == -1:
         print(f"Warning: Could not find section for {tag}, appending to end")
-        lines.append(f"\n[{tag}] {content}")
-    else:
-        # Find next section or end
-        insert_idx = section_idx + 1
-        
-        # Skip empty lines after header
-        while insert_idx < len(lines) and lines[insert_idx].strip() == '':
-            insert_idx += 1
-        
-        # Find next section (starts with ##)
-        while insert_idx < len(lines):
-            if lines[insert_idx].startswith('##'):
-                break
-            insert_idx += 1
-        
-        # Insert before next section
+        _append_bytes(filepath, f"\n\n[{tag}] {content}".encode())
+        return
+    
+    # Next section is the first later line starting with ##, else end of file
+    header_end = data.find(b'\n', section_pos)
+    next_section = data.find(b'\n##', header_end) if header_end != -1 else -1
+    
+    # Insert before next section, preceded by a blank line
+    if timestamp is None:
         timestamp = datetime.now().strftime("%H:%M")
-        entry = f"- [{timestamp}] {content}"
-        lines.insert(insert_idx, entry)
-        lines.insert(insert_idx, '')  # blank line
+    entry = f"- [{timestamp}] {content}"
+    
+    if next_section == -1:
+        _append_bytes(filepath, f"\n\n{entry}".encode())
+        return
     
-    # Write back
-    filepath.write_text('\n'.join(lines))
+    insert_at = next_section + 1
+    with open(filepath, 'r+b') as f:
+        f.seek(insert_at)
+        f.write(f"\n{entry}\n".encode() + data[insert_at:])
+
+def _append_bytes(filepath: Path, payload: bytes):
+    """True append (O_APPEND) — no read or rewrite of existing content."""
+    with open(filepath, 'ab') as f:
+        f.write(payload)
 
 def capture(tag: str, content: str, note: str = None):
     """
@@ -144,16 +148,17 @@ def capture(tag: str, content: str, note: str = None):
         note: Optional additional note
     """
     if tag not in VALID_TAGS:
-        print(f"Invalid tag: {tag}. Must be one of: {', '.join(VALID_TAGS)}")
+        print(f"Invalid tag: {tag}. Must be one of: {', '.join(SECTION_MARKERS)}")
         return False
     
-    filepath = get_today_file()
+    now = datetime.now()   # one clock read for both the file date and the entry time
+    filepath = get_today_file(now)
     
     full_content = content
     if note:
         full_content = f"{content} - {note}"
     
-    append_to_section(filepath, tag, full_content)
+    append_to_section(filepath, tag, full_content, now.strftime("%H:%M"))
     
     print(f"✅ Captured [{tag}]: {content}")
     print(f"   File: {filepath}")
@@ -170,7 +175,7 @@ def main():
         print('  python capture_interest.py "[DEEP-DIVE] China gold - why now?"')
         print('  python capture_interest.py "[MUTE] Sports content"')
         print()
-        print(f"Valid tags: {', '.join(VALID_TAGS)}")
+        print(f"Valid tags: {', '.join(SECTION_MARKERS)}")
         print("Default tag if omitted: THIS-WEEK")
         sys.exit(1)
     
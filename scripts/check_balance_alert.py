@@ -5,13 +5,13 @@ Exit codes: 0=OK, 1=WARNING, 2=CRITICAL, 3=SEVERE
 """
 
 import sys
-import os
+from pathlib import Path
 
-# Add project to path
-sys.path.insert(0, os.path.expanduser("~/Projects/personal-ai-agents"))
+sys.path.insert(0, str(Path(__file__).parent.parent))  # repo root, for core.balance_core
 
 try:
-    from core.track_usage import check_balance, BALANCE_THRESHOLDS
+    # Leaf module only — not core.track_usage and its import graph
+    from core.balance_core import check_balance, BALANCE_THRESHOLDS
     
     balance, warning_level = check_balance()
     
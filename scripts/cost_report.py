@@ -4,7 +4,7 @@ cost_report.py - Unified AI cost tracker across chat and curator runs.
 
 Reads two sources:
   - ~/.openclaw/workspace/logs/usage/daily_usage.json  (chat / Sonnet costs)
-  - ~/Projects/personal-ai-agents/curator_costs.json   (curator API costs per model)
+  - ~/Projects/personal-ai-agents/curator_costs.jsonl  (curator API costs per model, one record per line)
 
 Usage:
     python cost_report.py          # today's breakdown
@@ -13,44 +13,148 @@ Usage:
     python cost_report.py year     # this calendar year, month by month
 """
 
+import hashlib
 import json
+import os
 import sys
 import calendar
-from collections import defaultdict
-from datetime import datetime, timedelta, timezone
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, TypeVar
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:
+    ijson = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 CHAT_LOG    = Path.home() / '.openclaw' / 'workspace' / 'logs' / 'usage' / 'daily_usage.json'
-CURATOR_LOG = Path(__file__).parent.parent / 'curator_costs.json'
+CURATOR_LOG = Path(__file__).parent.parent / 'curator_costs.jsonl'
+# Pre-JSONL format, read only until scripts/migrate_curator_costs_jsonl.py has run
+LEGACY_CURATOR_LOG = CURATOR_LOG.with_suffix('.json')
+# Per-user cache of parsed logs (not the shared temp dir: other users can write there)
+CACHE_DIR   = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'cost_report'
+
+T = TypeVar('T')
 
 
 # ---------------------------------------------------------------------------
 # Loaders
 # ---------------------------------------------------------------------------
 
-def load_chat_costs() -> dict:
+def _loads(raw: bytes) -> Any:
+    """json.loads via orjson when installed (several times faster on these flat records)."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def load_chat_costs() -> Dict[str, float]:
     """Returns {date_str: cost_usd} from daily_usage.json."""
-    if not CHAT_LOG.exists():
+    try:
+        data = _loads(CHAT_LOG.read_bytes())
+    except FileNotFoundError:
         return {}
-    data = json.loads(CHAT_LOG.read_text())
     return {date: day.get('cost_usd', 0.0) for date, day in data.get('days', {}).items()}
 
 
-def load_curator_costs() -> list:
-    """Returns list of cost records from curator_costs.json. Creates file if missing."""
-    if not CURATOR_LOG.exists():
-        CURATOR_LOG.write_text(json.dumps({"runs": []}, indent=2))
-        return []
-    data = json.loads(CURATOR_LOG.read_text())
-    return data.get('runs', [])
+def iter_curator_runs() -> Iterator[dict]:
+    """Yields cost records from curator_costs.jsonl one line at a time.
+
+    Falls back to the legacy curator_costs.json if the JSONL log doesn't
+    exist yet (not migrated).
+    """
+    try:
+        f = open(CURATOR_LOG, 'rb')   # no exists() pre-check — one syscall on the common path
+    except FileNotFoundError:
+        yield from _iter_legacy_curator_runs()
+        return
+    with f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
+
+
+def _iter_legacy_curator_runs() -> Iterator[dict]:
+    """Yields records from the pre-JSONL {"runs": [...]} log.
+
+    Streams with ijson when available so memory stays O(1) per record;
+    falls back to a full orjson/json parse otherwise.
+    """
+    try:
+        f = open(LEGACY_CURATOR_LOG, 'rb')
+    except FileNotFoundError:
+        return  # no log yet: nothing to report, and a report writes nothing
+    with f:
+        if ijson is not None:
+            yield from ijson.items(f, 'runs.item', use_float=True)
+        else:
+            yield from _loads(f.read()).get('runs', [])
+
+
+def load_curator_costs() -> List[dict]:
+    """Returns list of cost records from curator_costs.jsonl (empty if there is no log)."""
+    return list(iter_curator_runs())
+
+
+def _dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+
+def load_cached(path: Path, loader: Callable[[], T]) -> T:
+    """Returns loader()'s result, reusing the JSON saved by the last run if `path` is unchanged.
+
+    One cache file per source path, tagged with (mtime_ns, size) — a repeat
+    invocation against an untouched log reads one compact file instead of
+    re-parsing the log. JSON rather than pickle, so a tampered cache file can
+    only ever yield wrong numbers, never run code.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return loader()
+    key        = [st.st_mtime_ns, st.st_size]
+    cache_path = CACHE_DIR / f"{hashlib.sha1(str(path).encode()).hexdigest()[:12]}.json"
+    try:
+        cached = _loads(cache_path.read_bytes())
+        if cached['key'] == key:
+            return cached['data']
+    except Exception:
+        pass   # missing, stale format, or corrupt — rebuild below
+    obj = loader()
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_bytes(_dumps({'key': key, 'data': obj}))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return obj
+
+
+def by_month(costs: Dict[str, float]) -> Dict[str, float]:
+    """Bucket {YYYY-MM-DD: cost} into {YYYY-MM: cost} in one pass."""
+    result: Dict[str, float] = defaultdict(float)
+    for date, cost in costs.items():
+        result[date[:7]] += cost
+    return result
 
 
-def curator_by_date(runs: list) -> dict:
-    """Aggregate curator runs into {date: {model: cost}} structure."""
-    result = defaultdict(lambda: defaultdict(float))
-    for r in runs:
-        result[r['date']][r['model']] += r.get('cost_usd', 0.0)
-    return result
+def date_range(first: date, last: date) -> List[str]:
+    """ISO date strings from first to last inclusive.
+
+    Steps over integer day ordinals and formats each once with isoformat(),
+    rather than a strftime per day.
+    """
+    return [date.fromordinal(o).isoformat() for o in range(first.toordinal(), last.toordinal() + 1)]
+
+
+def emit(lines: List[str]) -> None:
+    """Write a finished report to stdout in a single write() call."""
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def fmt(amount: float) -> str:
@@ -61,23 +165,36 @@ def fmt(amount: float) -> str:
 # Reports
 # ---------------------------------------------------------------------------
 
-def report_today(chat: dict, curator_runs: list):
-    today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+def report_today(chat: Dict[str, float], curator_runs: Iterable[dict], now: datetime) -> None:
+    today = now.date().isoformat()
     month = today[:7]
 
-    chat_today    = chat.get(today, 0.0)
-    curator_today = [r for r in curator_runs if r['date'] == today]
-
-    by_model = defaultdict(lambda: {'cost': 0.0, 'runs': 0})
-    for r in curator_today:
-        by_model[r['model']]['cost'] += r.get('cost_usd', 0.0)
-        by_model[r['model']]['runs'] += 1
+    chat_today = chat.get(today, 0.0)
 
-    curator_total = sum(v['cost'] for v in by_model.values())
+    # Last 7 days for context
+    today_date = now.date()
+    last7      = date_range(today_date - timedelta(days=6), today_date)
+
+    # One pass over the runs: today's per-model split, month total, recent days
+    model_cost: Counter[str] = Counter()
+    model_runs: Counter[str] = Counter()
+    month_curator = 0.0
+    cur_by_day    = dict.fromkeys(last7, 0.0)
+    for r in curator_runs:
+        d    = r['date']
+        cost = r.get('cost_usd', 0.0)
+        if d == today:
+            model_cost[r['model']] += cost
+            model_runs[r['model']] += 1
+        if d[:7] == month:
+            month_curator += cost
+        if d in cur_by_day:
+            cur_by_day[d] += cost
+
+    curator_total = sum(model_cost.values())
     grand_total   = chat_today + curator_total
 
-    month_chat    = sum(v for k, v in chat.items() if k.startswith(month))
-    month_curator = sum(r.get('cost_usd', 0.0) for r in curator_runs if r['date'].startswith(month))
+    month_chat    = by_month(chat).get(month, 0.0)
     month_total   = month_chat + month_curator
 
     lines = [
@@ -86,21 +203,18 @@ def report_today(chat: dict, curator_runs: list):
         f"Chat (Sonnet):    {fmt(chat_today)}",
     ]
 
-    if by_model:
+    if model_runs:
         lines.append("Curator:")
-        for model, v in sorted(by_model.items()):
-            runs_label = f"{v['runs']} run{'s' if v['runs'] != 1 else ''}"
-            lines.append(f"  {model:<22} {fmt(v['cost'])}  {runs_label}")
+        for model in sorted(model_runs):
+            n = model_runs[model]
+            runs_label = f"{n} run{'s' if n != 1 else ''}"
+            lines.append(f"  {model:<22} {fmt(model_cost[model])}  {runs_label}")
     else:
         lines.append("Curator:          $0.00  (no runs yet today)")
 
-    # Last 7 days for context
-    today_date = datetime.now(timezone.utc).date()
-    last7      = [(today_date - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(6, -1, -1)]
-    c_by_d     = curator_by_date(curator_runs)
-    recent     = []
+    recent = []
     for d in last7:
-        total = chat.get(d, 0.0) + sum(c_by_d.get(d, {}).values())
+        total = chat.get(d, 0.0) + cur_by_day[d]
         if total > 0:
             marker = " <- today" if d == today else ""
             recent.append(f"  {d}  {fmt(total)}{marker}")
@@ -114,23 +228,38 @@ def report_today(chat: dict, curator_runs: list):
         "-" * 32,
         f"Month so far:     {fmt(month_total)}",
     ]
-    print('\n'.join(lines))
+    emit(lines)
 
 
-def report_days(chat: dict, curator_runs: list, dates: list, label: str):
+def report_days(chat: Dict[str, float], curator_runs: Iterable[dict], dates: List[str],
+                label: str, now: datetime) -> None:
     """Day-by-day table for a list of date strings."""
-    c_by_d   = curator_by_date(curator_runs)
-    today    = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    today    = now.date().isoformat()
     col_w    = 10
     header   = f"{'Date':<12} {'Chat':>{col_w}} {'Curator':>{col_w}} {'Total':>{col_w}}"
     sep      = "-" * len(header)
 
+    # One pass over the runs: per-day totals plus the per-model breakdown.
+    # cur_by_day is pre-seeded with every date in range, so it doubles as the
+    # O(1) membership test and every later lookup is a plain index — no
+    # .get(d, default) per day.
+    day_chat     = {d: chat.get(d, 0.0) for d in dates}
+    cur_by_day   = dict.fromkeys(dates, 0.0)
+    model_totals: Dict[str, float] = defaultdict(float)
+    model_runs:   Dict[str, int]   = defaultdict(int)
+    for r in curator_runs:
+        if r['date'] in cur_by_day:
+            cost = r.get('cost_usd', 0.0)
+            cur_by_day[r['date']]    += cost
+            model_totals[r['model']] += cost
+            model_runs[r['model']]   += 1
+
     lines = [f"Cost Report - {label}", sep, header, sep]
 
     tot_chat = tot_cur = 0.0
     for d in dates:
-        cc    = chat.get(d, 0.0)
-        cur   = sum(c_by_d.get(d, {}).values())
+        cc    = day_chat[d]
+        cur   = cur_by_day[d]
         tot   = cc + cur
         tot_chat += cc
         tot_cur  += cur
@@ -143,13 +272,7 @@ def report_days(chat: dict, curator_runs: list, dates: list, label: str):
     ]
 
     # Curator model breakdown if any curator data exists
-    curator_in_range = [r for r in curator_runs if r['date'] in dates]
-    if curator_in_range:
-        model_totals = defaultdict(float)
-        model_runs   = defaultdict(int)
-        for r in curator_in_range:
-            model_totals[r['model']] += r.get('cost_usd', 0.0)
-            model_runs[r['model']]   += 1
+    if model_totals:
         lines.append("")
         lines.append("Curator by model:")
         for model in sorted(model_totals):
@@ -157,15 +280,21 @@ def report_days(chat: dict, curator_runs: list, dates: list, label: str):
             avg = model_totals[model] / n if n else 0
             lines.append(f"  {model:<24} {fmt(model_totals[model])}  ({n} runs, avg {fmt(avg)}/run)")
 
-    print('\n'.join(lines))
+    emit(lines)
 
 
-def report_year(chat: dict, curator_runs: list):
+def report_year(chat: Dict[str, float], curator_runs: Iterable[dict], now: datetime) -> None:
     """Month-by-month table for the current calendar year."""
-    year     = datetime.now(timezone.utc).year
-    today    = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    year     = now.year
+    today    = now.date().isoformat()
     cur_month = today[:7]
 
+    # One pass over each source, bucketed by YYYY-MM — then 12 lookups, not 12 scans
+    chat_by_month = by_month(chat)
+    cur_by_month: Dict[str, float] = defaultdict(float)
+    for r in curator_runs:
+        cur_by_month[r['date'][:7]] += r.get('cost_usd', 0.0)
+
     col_w  = 10
     header = f"{'Month':<12} {'Chat':>{col_w}} {'Curator':>{col_w}} {'Total':>{col_w}}"
     sep    = "-" * len(header)
@@ -177,12 +306,12 @@ def report_year(chat: dict, curator_runs: list):
         # Skip future months
         if month_str > cur_month:
             break
-        cc  = sum(v for k, v in chat.items() if k.startswith(month_str))
-        cur = sum(r.get('cost_usd', 0.0) for r in curator_runs if r['date'].startswith(month_str))
+        cc  = chat_by_month.get(month_str, 0.0)
+        cur = cur_by_month.get(month_str, 0.0)
         tot = cc + cur
         tot_chat += cc
         tot_cur  += cur
-        month_label = datetime(year, m, 1).strftime('%b %Y')
+        month_label = f"{calendar.month_abbr[m]} {year}"
         marker = " <- current" if month_str == cur_month else ""
         lines.append(f"{month_label:<12} {fmt(cc):>{col_w}} {fmt(cur):>{col_w}} {fmt(tot):>{col_w}}{marker}")
 
@@ -190,36 +319,34 @@ def report_year(chat: dict, curator_runs: list):
         sep,
         f"{'TOTAL':<12} {fmt(tot_chat):>{col_w}} {fmt(tot_cur):>{col_w}} {fmt(tot_chat + tot_cur):>{col_w}}",
     ]
-    print('\n'.join(lines))
+    emit(lines)
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
-def main():
-    chat         = load_chat_costs()
-    curator_runs = load_curator_costs()
+def main() -> None:
+    chat         = load_cached(CHAT_LOG, load_chat_costs)
+    curator_runs = load_cached(CURATOR_LOG if CURATOR_LOG.exists() else LEGACY_CURATOR_LOG,
+                               load_curator_costs)
     arg          = sys.argv[1].lower() if len(sys.argv) > 1 else 'today'
-    now          = datetime.now(timezone.utc)
+    now          = datetime.now(timezone.utc)   # read the clock once; reports derive from it
+    today_date   = now.date()
 
     if arg == 'today':
-        report_today(chat, curator_runs)
+        report_today(chat, curator_runs, now)
 
     elif arg == 'week':
-        today = now.date()
-        dates = [(today - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(6, -1, -1)]
-        report_days(chat, curator_runs, dates, "Last 7 Days")
+        dates = date_range(today_date - timedelta(days=6), today_date)
+        report_days(chat, curator_runs, dates, "Last 7 Days", now)
 
     elif arg == 'month':
-        month_str = now.strftime('%Y-%m')
-        _, days_in_month = calendar.monthrange(now.year, now.month)
-        dates = [f"{month_str}-{d:02d}" for d in range(1, days_in_month + 1)
-                 if f"{month_str}-{d:02d}" <= now.strftime('%Y-%m-%d')]
-        report_days(chat, curator_runs, dates, now.strftime('%B %Y'))
+        dates = date_range(today_date.replace(day=1), today_date)   # month so far
+        report_days(chat, curator_runs, dates, now.strftime('%B %Y'), now)
 
     elif arg == 'year':
-        report_year(chat, curator_runs)
+        report_year(chat, curator_runs, now)
 
     else:
         print(f"Unknown argument: {arg}")
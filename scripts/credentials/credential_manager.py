@@ -15,13 +15,114 @@ Usage:
     password = creds["password"]
 """
 
+import json
+import logging
 import os
+import re
 import sys
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+# Optional dependency, resolved once at import rather than on every call
+try:
+    import keyring
+except ImportError:
+    keyring = None
+
+log = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
+# Both fields live in one JSON-encoded Keychain item: one IPC round-trip
+# (and one unlock prompt) per lookup instead of two. Entries written under
+# the legacy separate "username"/"password" keys are migrated on first read.
+KEYCHAIN_ACCOUNT = "creds"
+
+# Process-lifetime cache: service -> (loaded_at, creds). Keychain lookups are
+# synchronous IPC on macOS, so repeat callers get a dict hit instead.
+# CRED_CACHE_TTL (seconds) bounds entry age; unset or 0 = cache for the process.
+_CRED_CACHE: Dict[str, Tuple[float, Dict[str, str]]] = {}
+_CRED_CACHE_TTL = float(os.getenv("CRED_CACHE_TTL", "0") or 0)
+
+
+def _cache_get(service: str) -> Optional[Dict[str, str]]:
+    entry = _CRED_CACHE.get(service)
+    if entry is None:
+        return None
+    loaded_at, creds = entry
+    if _CRED_CACHE_TTL and time.monotonic() - loaded_at > _CRED_CACHE_TTL:
+        _CRED_CACHE.pop(service, None)
+        return None
+    return creds
+
+
+def _cache_put(service: str, creds: Dict[str, str]) -> Dict[str, str]:
+    _CRED_CACHE[service] = (time.monotonic(), creds)
+    return creds
+
+
+# Concurrent misses for the same service share one lookup: the first caller
+# loads, the rest wait on its Future (one Keychain IPC / unlock prompt, not N).
+_INFLIGHT_LOCK = threading.Lock()
+_INFLIGHT: Dict[str, "Future[Dict[str, str]]"] = {}
+
+# Parsed .env contents, read at most once per process (None = not read yet)
+_ENV_FILE: Optional[Dict[str, str]] = None
+
+
+# An inline comment on an unquoted value: '#' after whitespace, as python-dotenv
+# reads it ("FOO=   # note" is empty, "FOO=a#b" keeps the '#')
+_ENV_COMMENT_RE = re.compile(rb'\s#')
+# A quoted value, optionally followed by a comment: KEY="abc"  # note
+_ENV_QUOTED_RE = re.compile(rb'([\'"])(.*?)\1\s*(?:#.*)?', re.DOTALL)
+
+
+def _env_value(raw: bytes) -> bytes:
+    """The value part of a .env line: inner text if quoted, else up to any comment."""
+    quoted = _ENV_QUOTED_RE.fullmatch(raw.strip())
+    if quoted:
+        return quoted.group(2)
+    comment = _ENV_COMMENT_RE.search(raw)
+    return (raw[:comment.start()] if comment else raw).strip()
+
+
+def _parse_env(path: Path) -> Dict[str, str]:
+    """
+    Minimal one-pass .env reader: KEY=value lines, '#' comments (whole-line
+    and after an unquoted value), optional 'export ' prefix and matching
+    surrounding quotes. No interpolation or multiline values — credentials
+    files here don't use them.
+    """
+    out = {}
+    with open(path, 'rb', buffering=65536) as f:
+        for raw in f:
+            line = raw.strip()
+            if not line or line[:1] == b'#':
+                continue
+            if line[:7] == b'export ':
+                line = line[7:]
+            k, eq, v = line.partition(b'=')
+            if not eq:
+                continue
+            out[k.strip().decode()] = _env_value(v).decode()
+    return out
+
+
+@lru_cache(maxsize=32)
+def _env_keys(service: str) -> Tuple[str, str]:
+    """.env variable names for a service, e.g. FOO_USERNAME / FOO_PASSWORD."""
+    s = service.upper()
+    return f"{s}_USERNAME", f"{s}_PASSWORD"
+
+
+def invalidate_credentials(service: str) -> None:
+    """Drop a service's cached credentials so the next lookup re-reads them."""
+    _CRED_CACHE.pop(service, None)
+
 
 def get_credentials(service: str) -> Dict[str, str]:
     """
@@ -36,44 +137,62 @@ def get_credentials(service: str) -> Dict[str, str]:
     Raises:
         ValueError: If credentials not found
     """
+    cached = _cache_get(service)
+    if cached is not None:
+        return cached
+    
+    with _INFLIGHT_LOCK:
+        fut = _INFLIGHT.get(service)
+        owner = fut is None
+        if owner:
+            fut = _INFLIGHT[service] = Future()
+    
+    if owner:
+        try:
+            fut.set_result(_cache_put(service, _load_credentials(service)))
+        except BaseException as e:
+            fut.set_exception(e)
+        finally:
+            with _INFLIGHT_LOCK:
+                _INFLIGHT.pop(service, None)
+    return fut.result()
+
+def _load_credentials(service: str) -> Dict[str, str]:
+    """Uncached lookup behind get_credentials()."""
+    global _ENV_FILE
+    
     # Try keychain first
-    try:
-        import keyring
-        username = keyring.get_password(service, "username")
-        password = keyring.get_password(service, "password")
-        
-        if username and password:
-            print(f"✅ Loaded {service} credentials from keychain")
-            return {"username": username, "password": password}
-    except ImportError:
-        print("⚠️  keyring module not installed (pip install keyring)")
-    except Exception as e:
-        print(f"⚠️  Keychain access failed: {e}")
+    if keyring is None:
+        log.warning("keyring module not installed (pip install keyring)")
+    else:
+        try:
+            creds = _read_keychain(service)
+            if creds:
+                log.info("Loaded %s credentials from keychain", service)
+                return creds
+        except Exception as e:
+            log.warning("Keychain access failed: %s", e)
     
     # Fall back to .env file
     try:
-        from dotenv import load_dotenv
-        
-        # Find .env in project root
+        # Find .env in project root; open directly rather than exists() + open
         env_path = PROJECT_ROOT / ".env"
-        if env_path.exists():
-            load_dotenv(env_path)
-            
-            username_key = f"{service.upper()}_USERNAME"
-            password_key = f"{service.upper()}_PASSWORD"
-            
-            username = os.getenv(username_key)
-            password = os.getenv(password_key)
-            
-            if username and password:
-                print(f"✅ Loaded {service} credentials from .env")
-                return {"username": username, "password": password}
-        else:
-            print(f"⚠️  .env file not found at {env_path}")
-    except ImportError:
-        print("⚠️  python-dotenv module not installed (pip install python-dotenv)")
+        if _ENV_FILE is None:
+            _ENV_FILE = _parse_env(env_path)
+        
+        username_key, password_key = _env_keys(service)
+        
+        # Real environment wins over .env, as with load_dotenv(override=False)
+        username = os.getenv(username_key) or _ENV_FILE.get(username_key)
+        password = os.getenv(password_key) or _ENV_FILE.get(password_key)
+        
+        if username and password:
+            log.info("Loaded %s credentials from .env", service)
+            return {"username": username, "password": password}
+    except FileNotFoundError:
+        log.warning(".env file not found at %s", env_path)
     except Exception as e:
-        print(f"⚠️  .env loading failed: {e}")
+        log.warning(".env loading failed: %s", e)
     
     # No credentials found
     raise ValueError(
@@ -83,6 +202,28 @@ def get_credentials(service: str) -> Dict[str, str]:
         f"2. Create .env file with {service.upper()}_USERNAME and {service.upper()}_PASSWORD"
     )
 
+def _read_keychain(service: str) -> Optional[Dict[str, str]]:
+    """One Keychain read for the combined item; legacy two-key entries are rewritten combined."""
+    raw = keyring.get_password(service, KEYCHAIN_ACCOUNT)
+    if raw:
+        data = json.loads(raw)
+        if data.get("username") and data.get("password"):
+            return {"username": data["username"], "password": data["password"]}
+        return None
+    
+    username = keyring.get_password(service, "username")
+    password = keyring.get_password(service, "password")
+    if not (username and password):
+        return None
+    
+    # One-time migration to the combined item
+    try:
+        keyring.set_password(service, KEYCHAIN_ACCOUNT,
+                             json.dumps({"username": username, "password": password}))
+    except Exception as e:
+        log.warning("Could not migrate %s to combined keychain item: %s", service, e)
+    return {"username": username, "password": password}
+
 def store_credentials(service: str, username: str, password: str) -> bool:
     """
     Store credentials in macOS Keychain
@@ -95,35 +236,45 @@ def store_credentials(service: str, username: str, password: str) -> bool:
     Returns:
         True if successful
     """
+    if keyring is None:
+        log.error("keyring module not installed (pip install keyring)")
+        return False
     try:
-        import keyring
-        keyring.set_password(service, "username", username)
-        keyring.set_password(service, "password", password)
-        print(f"✅ Stored {service} credentials in keychain")
+        keyring.set_password(service, KEYCHAIN_ACCOUNT,
+                             json.dumps({"username": username, "password": password}))
+        invalidate_credentials(service)
+        log.info("Stored %s credentials in keychain", service)
         return True
-    except ImportError:
-        print("❌ keyring module not installed (pip install keyring)")
-        return False
     except Exception as e:
-        print(f"❌ Failed to store credentials: {e}")
+        log.error("Failed to store credentials: %s", e)
         return False
 
 def delete_credentials(service: str) -> bool:
     """Delete credentials from keychain"""
+    if keyring is None:
+        log.warning("Could not delete: keyring module not installed (pip install keyring)")
+        return False
     try:
-        import keyring
-        keyring.delete_password(service, "username")
-        keyring.delete_password(service, "password")
-        print(f"✅ Deleted {service} credentials from keychain")
+        keyring.delete_password(service, KEYCHAIN_ACCOUNT)
+        for legacy in ("username", "password"):
+            try:
+                keyring.delete_password(service, legacy)
+            except Exception:
+                pass   # never written, or already migrated away
+        invalidate_credentials(service)
+        log.info("Deleted %s credentials from keychain", service)
         return True
     except Exception as e:
-        print(f"⚠️  Could not delete: {e}")
+        log.warning("Could not delete: %s", e)
         return False
 
 # CLI interface for manual credential management
 if __name__ == "__main__":
     import getpass
     
+    # CLI use: show the library's diagnostics on the console
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    
     if len(sys.argv) < 3:
         print("Usage:")
         print("  Store:   python scripts/credentials/credential_manager.py store <service>")
@@ -17,6 +17,15 @@ aws ecr get-login-password --region ${REGION} | \
 echo "=== Pulling image set: ${MINIMOI_IMAGE_TAG} ==="
 docker-compose -f ${COMPOSE} pull
 
+echo "=== Preparing curator cost log ==="
+# The compose file bind-mounts this single file; if it is missing Docker
+# creates a directory in its place and cost logging fails.
+MIGRATE="/opt/minimoi/scripts/migrate_curator_costs_jsonl.py"
+if [ -f "${MIGRATE}" ]; then
+  python3 "${MIGRATE}" /opt/minimoi/data/curator_costs.json
+fi
+touch /opt/minimoi/data/curator_costs.jsonl
+
 echo "=== Restarting containers ==="
 docker-compose -f ${COMPOSE} up -d --remove-orphans
 
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+scripts/migrate_curator_costs_jsonl.py — one-time migration: convert the
+curator cost log from curator_costs.json ({"runs": [...]}) to
+curator_costs.jsonl (one record per line).
+
+The JSONL log is append-only: log_curator_cost() writes one line per call
+instead of reading and rewriting the whole file. Any lines already appended
+to the .jsonl before this runs are kept, after the migrated history. The
+old file is renamed to curator_costs.json.migrated rather than deleted.
+Idempotent — with no curator_costs.json present there is nothing to do.
+
+Usage:
+    python scripts/migrate_curator_costs_jsonl.py [--dry-run] [path/to/curator_costs.json]
+
+    # EC2 host (the deploy workflow and scripts/deploy.sh run this before `up`):
+    python3 /opt/minimoi/scripts/migrate_curator_costs_jsonl.py /opt/minimoi/data/curator_costs.json
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+LEGACY_LOG = REPO_ROOT / "curator_costs.json"
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    dry_run = "--dry-run" in sys.argv
+
+    legacy = Path(args[0]) if args else LEGACY_LOG
+    target = legacy.with_suffix(".jsonl")
+
+    if not legacy.exists():
+        print(f"No legacy log at {legacy} — nothing to do.")
+        return
+
+    runs = json.loads(legacy.read_text()).get("runs", [])
+    appended = target.read_bytes() if target.exists() else b""
+
+    if dry_run:
+        kept = appended.count(b"\n")
+        print(f"DRY RUN: would write {len(runs)} migrated records to {target}"
+              f" (keeping {kept} already-appended lines)")
+        return
+
+    tmp = target.with_suffix(".jsonl.tmp")
+    with open(tmp, "wb") as f:
+        for r in runs:
+            f.write(json.dumps(r).encode() + b"\n")
+        f.write(appended)
+    os.replace(tmp, target)
+    legacy.rename(legacy.with_suffix(".json.migrated"))
+
+    print(f"OK: {len(runs)} records → {target}")
+    print(f"    old log kept as {legacy.with_suffix('.json.migrated')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,5 +19,7 @@ until "$DOCKER" info > /dev/null 2>&1; do
 done
 
 echo "[$(date)] Docker ready after ${WAITED}s. Starting containers..."
+# Bind-mounted as a single file: it must exist, or Docker creates a directory.
+touch "$(dirname "$COMPOSE_FILE")/curator_costs.jsonl"
 "$DOCKER" compose -f "$COMPOSE_FILE" up -d --wait
 echo "[$(date)] docker compose up complete: $?"
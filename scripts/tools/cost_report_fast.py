@@ -0,0 +1,24 @@
+#!/usr/bin/env pypy3
+"""
+cost_report_fast.py — run scripts/cost_report.py under PyPy.
+
+cost_report is pure dict/list/string glue (JSON load, date bucketing,
+table formatting), which PyPy's JIT handles well. This wrapper only
+changes the interpreter; output is identical.
+
+For CPython, the same module is fully annotated and compiles with mypyc:
+    cd scripts && mypyc cost_report.py
+
+Usage:
+    pypy3 scripts/tools/cost_report_fast.py [today|week|month|year]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cost_report import main
+
+if __name__ == '__main__':
+    main()
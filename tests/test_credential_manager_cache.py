@@ -0,0 +1,161 @@
+"""
+scripts/credentials/credential_manager.py — process-lifetime credential cache
+and the combined single-item Keychain layout.
+
+get_credentials() must hit the Keychain once per service per process, and
+store/delete must invalidate so the next lookup sees the new value. Entries
+stored under the legacy separate username/password keys must still load,
+and be rewritten as one combined item. The .env fallback is parsed without
+python-dotenv and never overrides the real environment. Concurrent misses
+for one service share a single lookup.
+"""
+import threading
+import time
+import types
+
+import pytest
+
+from scripts.credentials import credential_manager as cm
+
+
+class FakeKeyring:
+    def __init__(self):
+        self.store = {}
+        self.reads = 0
+
+    def get_password(self, service, key):
+        self.reads += 1
+        return self.store.get((service, key))
+
+    def set_password(self, service, key, value):
+        self.store[(service, key)] = value
+
+    def delete_password(self, service, key):
+        self.store.pop((service, key), None)
+
+
+@pytest.fixture
+def fake_keyring(monkeypatch):
+    fake = FakeKeyring()
+    module = types.ModuleType("keyring")
+    module.get_password = fake.get_password
+    module.set_password = fake.set_password
+    module.delete_password = fake.delete_password
+    monkeypatch.setattr(cm, "keyring", module)
+    monkeypatch.setattr(cm, "_CRED_CACHE", {})
+    monkeypatch.setattr(cm, "PROJECT_ROOT", cm.PROJECT_ROOT / "no-such-dir")
+    return fake
+
+
+def test_repeat_lookup_is_served_from_cache(fake_keyring):
+    cm.store_credentials("svc", "alice", "s3cret")
+
+    first = cm.get_credentials("svc")
+    reads_after_first = fake_keyring.reads
+    second = cm.get_credentials("svc")
+
+    assert first == second == {"username": "alice", "password": "s3cret"}
+    assert fake_keyring.reads == reads_after_first
+
+
+def test_store_invalidates_cached_entry(fake_keyring):
+    cm.store_credentials("svc", "alice", "old")
+    cm.get_credentials("svc")
+
+    cm.store_credentials("svc", "alice", "new")
+
+    assert cm.get_credentials("svc")["password"] == "new"
+
+
+def test_delete_invalidates_cached_entry(fake_keyring):
+    cm.store_credentials("svc", "alice", "s3cret")
+    cm.get_credentials("svc")
+
+    cm.delete_credentials("svc")
+
+    with pytest.raises(ValueError):
+        cm.get_credentials("svc")
+
+
+def test_ttl_expires_entries(fake_keyring, monkeypatch):
+    monkeypatch.setattr(cm, "_CRED_CACHE_TTL", 10.0)
+    clock = iter([100.0, 105.0, 200.0, 200.0])
+    monkeypatch.setattr(cm.time, "monotonic", lambda: next(clock))
+    cm.store_credentials("svc", "alice", "s3cret")
+
+    cm.get_credentials("svc")             # loaded at t=100
+    reads = fake_keyring.reads
+    cm.get_credentials("svc")             # t=105, still fresh
+    assert fake_keyring.reads == reads
+    cm.get_credentials("svc")             # t=200, expired -> re-read
+    assert fake_keyring.reads > reads
+
+
+def test_lookup_is_a_single_keychain_read(fake_keyring):
+    cm.store_credentials("svc", "alice", "s3cret")
+
+    cm.get_credentials("svc")
+
+    assert fake_keyring.reads == 1
+
+
+def test_legacy_two_key_entry_is_read_and_migrated(fake_keyring):
+    fake_keyring.store[("svc", "username")] = "alice"
+    fake_keyring.store[("svc", "password")] = "s3cret"
+
+    assert cm.get_credentials("svc") == {"username": "alice", "password": "s3cret"}
+    assert ("svc", cm.KEYCHAIN_ACCOUNT) in fake_keyring.store
+
+    cm.invalidate_credentials("svc")
+    reads = fake_keyring.reads
+    cm.get_credentials("svc")
+    assert fake_keyring.reads == reads + 1
+
+
+def test_env_file_fallback(fake_keyring, monkeypatch, tmp_path):
+    (tmp_path / ".env").write_text(
+        "# comment\n"
+        "export SVC_USERNAME='alice'\n"
+        'SVC_PASSWORD="p#ss=word"\n'
+        "OTHER_PASSWORD=from-file\n"
+        "BLANK_USERNAME=           # filled in later\n"
+        "BLANK_PASSWORD=ends-in-quote'\n"
+        'QUOTED_USERNAME="abc" # note\n'
+        "QUOTED_PASSWORD='a #b'  # note with 'quotes'\n"
+    )
+    monkeypatch.setattr(cm, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(cm, "_ENV_FILE", None)
+    monkeypatch.setenv("OTHER_USERNAME", "bob")
+    monkeypatch.setenv("OTHER_PASSWORD", "from-env")
+
+    assert cm.get_credentials("svc") == {"username": "alice", "password": "p#ss=word"}
+    assert cm.get_credentials("other") == {"username": "bob", "password": "from-env"}
+    # Inline comment after an empty value; an unmatched quote is kept
+    assert cm._parse_env(tmp_path / ".env")["BLANK_USERNAME"] == ""
+    assert cm._parse_env(tmp_path / ".env")["BLANK_PASSWORD"] == "ends-in-quote'"
+    # A quoted value followed by a comment loses both the quotes and the comment
+    assert cm._parse_env(tmp_path / ".env")["QUOTED_USERNAME"] == "abc"
+    assert cm._parse_env(tmp_path / ".env")["QUOTED_PASSWORD"] == "a #b"
+
+
+def test_concurrent_misses_share_one_lookup(fake_keyring, monkeypatch):
+    cm.store_credentials("svc", "alice", "s3cret")
+    real_get = fake_keyring.get_password
+
+    def slow_get(service, key):
+        time.sleep(0.05)
+        return real_get(service, key)
+
+    monkeypatch.setattr(cm.keyring, "get_password", slow_get)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cm.get_credentials("svc")))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert fake_keyring.reads == 1
+    assert results == [{"username": "alice", "password": "s3cret"}] * 8
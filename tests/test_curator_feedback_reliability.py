@@ -3,6 +3,7 @@ import json
 import os
 import subprocess
 import sys
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -15,6 +16,61 @@ from domains.curator import research_routes
 ROOT = Path(__file__).resolve().parents[1]
 
 
+def _tool_reply(request, payload):
+    """A Message whose only block calls the tool the request forces, with payload."""
+    name = request["tool_choice"]["name"]
+    tool_input = {"items": payload} if name == "record_metadata_batch" else payload
+    block = type("Block", (), {"type": "tool_use", "name": name, "input": tool_input})()
+    return type("Resp", (), {"content": [block], "stop_reason": "tool_use"})()
+
+
+@pytest.fixture
+def fake_metadata_model(tmp_path, monkeypatch):
+    """Point curator_feedback's metadata calls at reply(request) -> Message.
+
+    Returns install(reply, async_reply=None, batches=None), which returns the
+    list of requests sent through the synchronous client. async_reply, when
+    given, answers the concurrent AsyncAnthropic path; batches stands in for
+    client.messages.batches.
+    """
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+    monkeypatch.setattr(feedback, "get_anthropic_api_key", lambda: "key")
+    monkeypatch.setattr(feedback, "METADATA_CACHE_FILE", tmp_path / "metadata_cache.json")
+
+    def install(reply, async_reply=None, batches=None):
+        calls = []
+
+        class FakeMessages:
+            def create(self, **kwargs):
+                calls.append(kwargs)
+                return reply(kwargs)
+
+        FakeMessages.batches = batches
+        client = type("Client", (), {"messages": FakeMessages()})()
+        monkeypatch.setattr(feedback, "_anthropic_client", lambda api_key: client)
+
+        if async_reply is not None:
+            class FakeAsyncMessages:
+                async def create(self, **kwargs):
+                    return async_reply(kwargs)
+
+            class FakeAsyncAnthropic:
+                messages = FakeAsyncMessages()
+
+                async def __aenter__(self):
+                    return self
+
+                async def __aexit__(self, *exc):
+                    return False
+
+            monkeypatch.setattr(
+                feedback, "_async_anthropic_client", lambda api_key: FakeAsyncAnthropic()
+            )
+        return calls
+
+    return install
+
+
 def test_web_feedback_uses_submitted_article_without_ai_or_legacy_output(
     tmp_path, monkeypatch
 ):
@@ -93,6 +149,415 @@ def test_each_daily_feedback_action_is_persisted(
     assert entry["your_words"] == note
 
 
+def test_curator_output_keeps_articles_without_url_or_scores(tmp_path, monkeypatch):
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+    output = tmp_path / "curator_output.txt"
+    output.write_text(
+        "TOP 2 CURATED ARTICLES (Category + Diversity Weighted)\n\n"
+        "#1 [Src A] 🏷️  geo (ai)\n"
+        "   ID: abc12\n"
+        "   First title\n"
+        "   https://a/1\n"
+        "   Published: 2026-01-01 00:00 UTC\n"
+        "   Scores: 7.5/10 (raw: 1.0, final: 2.0)\n"
+        "   http-looking summary...\n\n"
+        "#2 [Src B] 🏷️  fiscal (keyword)\n"
+        "   ID: def34\n"
+        "   No link title\n"
+        "   \n"
+        "   Published: Unknown date\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(feedback, "CURATOR_OUTPUT", output)
+
+    articles = feedback.parse_curator_output()
+
+    assert articles[1]["url"] == "https://a/1"
+    assert articles[1]["scores"].startswith("Scores: 7.5/10")
+    assert articles[2] == {
+        "rank": 2, "source": "Src B", "category": "fiscal", "title": "No link title",
+        "url": None, "scores": None, "hash_id": "def34",
+    }
+
+
+def test_preferences_are_reparsed_only_after_the_file_changes(tmp_path, monkeypatch):
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+    prefs_path = tmp_path / "curator_preferences.json"
+    prefs_path.write_text(json.dumps({"feedback_history": {}, "marker": 1}))
+    monkeypatch.setattr(feedback, "PREFERENCES_FILE", prefs_path)
+
+    first = feedback.load_preferences()
+    assert feedback.load_preferences() is first
+
+    saved = {"feedback_history": {}, "marker": 2, "pad": "x"}
+    feedback.save_preferences(saved)
+    assert feedback.load_preferences() is saved
+
+    prefs_path.write_text(json.dumps({"feedback_history": {}, "marker": 3, "pad": "xyz"}))
+    assert feedback.load_preferences()["marker"] == 3
+
+
+def test_server_reuses_parsed_json_until_the_file_changes(tmp_path):
+    prefs_path = tmp_path / "curator_preferences.json"
+    prefs_path.write_text(json.dumps({"feedback_history": {}, "marker": 1}))
+
+    first = curator_server._read_json_cached(prefs_path)
+    assert curator_server._read_json_cached(prefs_path) is first
+
+    prefs_path.write_text(json.dumps({"feedback_history": {}, "marker": 2, "pad": "x"}))
+    assert curator_server._read_json_cached(prefs_path)["marker"] == 2
+
+def test_priority_feed_save_writes_preferences_once_per_url(
+    curator_client, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(curator_server, "_DATA_DIR", tmp_path)
+    article = {"url": "https://example.com/a", "title": "Café economics",
+               "source": "Example", "score": 7, "priority_id": "p1"}
+
+    first = curator_client.post("/api/priority-feed/save", json=article)
+    again = curator_client.post("/api/priority-feed/save", json=article)
+
+    assert first.get_json() == {"success": True, "already_saved": False}
+    assert again.get_json() == {"success": True, "already_saved": True}
+    prefs = json.loads((tmp_path / "curator_preferences.json").read_text(encoding="utf-8"))
+    (saved,) = [e for day in prefs["feedback_history"].values() for e in day["saved"]]
+    assert saved["title"] == "Café economics"
+    assert saved["score"] == 7.0
+
+def test_learned_pattern_weights_accumulate_and_save_as_plain_json(tmp_path, monkeypatch):
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+    prefs_path = tmp_path / "curator_preferences.json"
+    prefs_path.write_text(json.dumps({
+        "feedback_history": {},
+        "learned_patterns": {"preferred_themes": {"debt": 3}, "sample_size": 1},
+    }))
+    monkeypatch.setattr(feedback, "PREFERENCES_FILE", prefs_path)
+
+    prefs = feedback.load_preferences()
+    metadata = {"content_type": ["analysis"], "themes": ["debt", "rates"],
+                "signals": ["clickbait"], "source": "Example"}
+    feedback.update_learned_patterns(prefs, metadata, "liked")
+    feedback.update_learned_patterns(prefs, metadata, "disliked")
+    feedback.save_preferences(prefs)
+
+    patterns = json.loads(prefs_path.read_text())["learned_patterns"]
+    assert patterns["preferred_themes"] == {"debt": 4, "rates": 1}
+    assert patterns["preferred_content_types"] == {"analysis": 1}
+    assert patterns["preferred_sources"] == {"Example": 1}
+    assert patterns["avoid_patterns"] == {"clickbait": 1}
+    assert patterns["sample_size"] == 3
+
+
+def test_metadata_extraction_reuses_cached_answer(fake_metadata_model):
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+    calls = fake_metadata_model(lambda request: _tool_reply(request, {
+        "content_type": ["analytical"], "appeal": ["depth"], "style": [],
+        "themes": ["fiscal_policy"], "depth": "deep_dive", "signals": [],
+    }))
+
+    article = {"title": "Debt", "source": "Example", "category": "fiscal"}
+    first = feedback.extract_metadata(article, "sharp argument", "liked")
+    first["source"] = "Example"
+    second = feedback.extract_metadata(article, "sharp argument", "liked")
+    feedback.extract_metadata(article, "different words", "liked")
+
+    assert len(calls) == 2
+    assert calls[0]["tool_choice"] == {"type": "tool", "name": "record_metadata"}
+    assert second["depth"] == "deep_dive"
+    assert "source" not in second
+
+
+def test_metadata_falls_back_to_sonnet_when_haiku_reply_is_unusable(fake_metadata_model):
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+
+    def reply(request):
+        if request["model"] == feedback.METADATA_MODEL:
+            return _tool_reply(request, {"content_type": ["analytical"]})
+        return _tool_reply(request, {
+            "content_type": ["analytical"], "appeal": [], "style": [],
+            "themes": [], "depth": "deep_dive", "signals": [],
+        })
+
+    calls = fake_metadata_model(reply)
+
+    article = {"title": "Debt", "source": "Example", "category": "fiscal"}
+    metadata = feedback.extract_metadata(article, "sharp argument", "liked")
+
+    assert [call["model"] for call in calls] == ["claude-haiku-4-5", "claude-sonnet-4-5"]
+    assert metadata["depth"] == "deep_dive"
+
+def test_metadata_falls_back_to_sonnet_when_haiku_request_raises(fake_metadata_model):
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+
+    def reply(request):
+        if request["model"] == feedback.METADATA_MODEL:
+            raise ConnectionError("dropped")
+        return _tool_reply(request, {
+            "content_type": ["analytical"], "appeal": [], "style": [],
+            "themes": [], "depth": "deep_dive", "signals": [],
+        })
+
+    calls = fake_metadata_model(reply)
+
+    article = {"title": "Debt", "source": "Example", "category": "fiscal"}
+    metadata = feedback.extract_metadata(article, "sharp argument", "liked")
+
+    assert len(calls) == 2
+    assert metadata["depth"] == "deep_dive"
+
+
+def test_metadata_is_unknown_when_no_model_gives_a_usable_reply(fake_metadata_model):
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+    calls = fake_metadata_model(
+        lambda request: _tool_reply(request, {"content_type": ["analytical"]})
+    )
+
+    article = {"title": "Debt", "source": "Example", "category": "fiscal"}
+    metadata = feedback.extract_metadata(article, "sharp argument", "liked")
+
+    assert len(calls) == 2
+    assert metadata["content_type"] == ["unknown"]
+    assert metadata["themes"] == [] and metadata["depth"] == "unknown"
+    # The unusable reply was not cached
+    feedback.extract_metadata(article, "sharp argument", "liked")
+    assert len(calls) == 4
+
+def test_feedback_batch_extracts_metadata_in_one_request(
+    tmp_path, monkeypatch, fake_metadata_model
+):
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+    meta = {"content_type": ["analytical"], "appeal": [], "style": [],
+            "themes": [], "depth": "deep_dive", "signals": []}
+    calls = fake_metadata_model(
+        lambda request: _tool_reply(request, [meta, dict(meta, depth="surface_summary")])
+    )
+    monkeypatch.setattr(feedback, "PREFERENCES_FILE", tmp_path / "curator_preferences.json")
+    monkeypatch.setattr(feedback, "log_feedback", lambda **kwargs: None)
+    articles = {
+        rank: {"rank": rank, "title": f"T{rank}", "source": "S", "category": "fiscal",
+               "url": f"https://e/{rank}", "hash_id": f"h{rank}"}
+        for rank in (1, 2)
+    }
+    monkeypatch.setattr(feedback, "parse_curator_output", lambda: articles)
+
+    results = feedback.record_feedback_batch([
+        {"rank": 1, "type": "like", "text": "sharp argument"},
+        {"rank": "2", "type": "dislike", "text": "too much jargon"},
+        {"rank": 2, "type": "save"},
+        {"rank": 9, "type": "like"},
+    ])
+
+    assert len(calls) == 1
+    assert [r["entry"]["extracted_signals"]["depth"] for r in results] == [
+        "deep_dive", "surface_summary", "unknown",
+    ]
+    # No text: the default note is recorded without asking the model
+    assert results[2]["entry"]["your_words"] == "Saved via cli"
+    assert results[2]["entry"]["extracted_signals"]["content_type"] == []
+    # Both answers were cached under their single-item keys
+    assert feedback.extract_metadata(articles[1], "sharp argument", "liked")["depth"] == "deep_dive"
+    assert len(calls) == 1
+
+
+def test_default_feedback_notes_are_trivial():
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+
+    for note in ("Saved via cli", "Liked via telegram", "liked from Telegram",
+                 "Disliked from Telegram", "saved from telegram"):
+        assert feedback._is_trivial_feedback(note), note
+    assert not feedback._is_trivial_feedback("liked from Telegram, great sourcing")
+
+
+def test_feedback_batch_asks_items_concurrently_when_the_array_is_off(fake_metadata_model):
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+    meta = {"content_type": ["analytical"], "appeal": [], "style": [],
+            "themes": [], "depth": "deep_dive", "signals": []}
+    concurrent = []
+
+    def reply(request):
+        if request["tool_choice"]["name"] == "record_metadata_batch":
+            return _tool_reply(request, [meta])  # one object for two items
+        return _tool_reply(request, meta)
+
+    def async_reply(request):
+        concurrent.append(request["messages"][0]["content"])
+        if "jargon" in concurrent[-1]:
+            raise ConnectionError("dropped")
+        return _tool_reply(request, meta)
+
+    combined = fake_metadata_model(reply, async_reply)
+
+    article = {"title": "Debt", "source": "Example", "category": "fiscal"}
+    results = feedback.extract_metadata_batch([
+        (article, "sharp argument", "liked"),
+        (article, "too much jargon", "disliked"),
+    ])
+
+    assert len(concurrent) == 2
+    assert results[0]["depth"] == "deep_dive"
+    # The failed request was retried once on the synchronous path
+    assert len(combined) == 2 and "jargon" in combined[1]["messages"][0]["content"]
+
+def test_feedback_batch_chunks_combined_requests_and_survives_a_failed_one(
+    fake_metadata_model
+):
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+    meta = {"content_type": ["analytical"], "appeal": [], "style": [],
+            "themes": [], "depth": "deep_dive", "signals": []}
+    concurrent = []
+
+    def reply(request):
+        if len(combined) == 1:
+            raise ValueError("Streaming is required")
+        return _tool_reply(request, [meta] * request["messages"][0]["content"].count("Item "))
+
+    def async_reply(request):
+        concurrent.append(request)
+        return _tool_reply(request, meta)
+
+    combined = fake_metadata_model(reply, async_reply)
+
+    article = {"title": "Debt", "source": "Example", "category": "fiscal"}
+    results = feedback.extract_metadata_batch(
+        [(article, f"sharp argument number {n}", "liked") for n in range(80)]
+    )
+
+    assert [call["max_tokens"] for call in combined] == [
+        50 * feedback._METADATA_MAX_TOKENS, 30 * feedback._METADATA_MAX_TOKENS,
+    ]
+    # The failed first chunk is asked per item instead of aborting the batch
+    assert len(concurrent) == 50
+    assert all(r["depth"] == "deep_dive" for r in results)
+
+def test_deferred_feedback_batch_uses_message_batches(monkeypatch, fake_metadata_model):
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+    meta = {"content_type": ["analytical"], "appeal": [], "style": [],
+            "themes": [], "depth": "deep_dive", "signals": []}
+    submitted, polls = [], []
+
+    def result(custom_id, kind, params=None):
+        message = _tool_reply(params, meta) if params else None
+        return type("Item", (), {"custom_id": custom_id,
+                                 "result": type("Res", (), {"type": kind, "message": message})()})()
+
+    class FakeBatches:
+        def create(self, requests):
+            submitted.extend(requests)
+            return type("Batch", (), {"id": "b1", "processing_status": "in_progress"})()
+
+        def retrieve(self, batch_id):
+            polls.append(batch_id)
+            return type("Batch", (), {"id": batch_id, "processing_status": "ended"})()
+
+        def results(self, batch_id):
+            first, second = submitted
+            return [result(first["custom_id"], "succeeded", first["params"]),
+                    result(second["custom_id"], "errored")]
+
+    single = fake_metadata_model(
+        lambda request: _tool_reply(request, dict(meta, depth="surface_summary")),
+        batches=FakeBatches(),
+    )
+    monkeypatch.setattr(feedback, "_BATCH_POLL_START", 0)
+
+    article = {"title": "Debt", "source": "Example", "category": "fiscal"}
+    results = feedback.extract_metadata_batch([
+        (article, "sharp argument", "liked"),
+        (article, "too much jargon", "disliked"),
+    ], deferred=True)
+
+    assert len(submitted) == 2 and polls == ["b1"]
+    assert submitted[0]["params"]["system"][0]["cache_control"] == {"type": "ephemeral"}
+    # The errored request falls back to a direct call
+    assert [r["depth"] for r in results] == ["deep_dive", "surface_summary"]
+    assert len(single) == 1
+
+def test_bookmark_updates_history_in_place_and_skips_repeat_writes(tmp_path, monkeypatch):
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+    history_file = tmp_path / "curator_history.json"
+    history_file.write_text(json.dumps({"abc12": {"title": "T"}, "other": {"title": "O"}}))
+    monkeypatch.setattr(feedback, "REPO_ROOT", tmp_path)
+
+    assert feedback.mark_bookmarked("abc12", "scans/abc12-t.md") is True
+    history = json.loads(history_file.read_text())
+    assert history["abc12"]["bookmarked"] is True
+    assert history["abc12"]["deep_dive_path"] == "scans/abc12-t.md"
+    assert history["other"] == {"title": "O"}
+
+    mtime = history_file.stat().st_mtime_ns
+    assert feedback.mark_bookmarked("abc12", "scans/abc12-t.md") is True
+    assert history_file.stat().st_mtime_ns == mtime
+    assert feedback.mark_bookmarked("missing", "x.md") is False
+
+
+def test_bookmark_waits_for_the_history_lock(tmp_path, monkeypatch):
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+    history_file = tmp_path / "curator_history.json"
+    history_file.write_text(json.dumps({"abc12": {"title": "T"}}))
+    monkeypatch.setattr(feedback, "REPO_ROOT", tmp_path)
+
+    with feedback.history_lock(history_file):
+        worker = threading.Thread(
+            target=feedback.mark_bookmarked, args=("abc12", "scans/abc12-t.md")
+        )
+        worker.start()
+        worker.join(0.2)
+        assert worker.is_alive()
+        assert "bookmarked" not in json.loads(history_file.read_text())["abc12"]
+    worker.join(5)
+
+    assert json.loads(history_file.read_text())["abc12"]["bookmarked"] is True
+
+
+def test_scans_index_is_rewritten_only_when_scans_change(tmp_path, monkeypatch):
+    feedback = importlib.import_module("domains.curator.curator_feedback")
+    scans_dir = tmp_path / "interests" / "2026" / "scans"
+    scans_dir.mkdir(parents=True)
+    monkeypatch.setattr(feedback, "REPO_ROOT", tmp_path)
+
+    def add_scan(hash_id, title):
+        (scans_dir / f"{hash_id}-scan.md").write_text(
+            f"# {title}\n\n**Source:** Src  \n**URL:** https://e/{hash_id}  \n"
+            f"**Date:** 2026-07-01  \n**Hash ID:** {hash_id}\n"
+        )
+
+    add_scan("aaaaa", "First scan")
+    feedback.regenerate_scans_index()
+    index_file = scans_dir / "index.html"
+    assert "First scan" in index_file.read_text()
+
+    index_file.write_text("sentinel")
+    feedback.regenerate_scans_index()
+    assert index_file.read_text() == "sentinel"
+
+    add_scan("bbbbb", "Second scan")
+    feedback.regenerate_scans_index()
+    assert "Second scan" in index_file.read_text()
+
+    # An unparseable date gets a fixed fallback, so it does not churn the stamp.
+    (scans_dir / "ccccc-scan.md").write_text(
+        "# Undated scan\n\n**Source:** Src  \n**Date:** someday  \n**Hash ID:** ccccc\n"
+    )
+    feedback.regenerate_scans_index()
+    assert "Undated scan" in index_file.read_text()
+    index_file.write_text("sentinel")
+    feedback.regenerate_scans_index()
+    assert index_file.read_text() == "sentinel"
+
+    # A template change re-renders even though the entries are the same.
+    monkeypatch.setattr(
+        feedback, "_SCANS_INDEX_TEMPLATE", feedback._SCANS_INDEX_TEMPLATE + "<!-- v2 -->"
+    )
+    feedback.regenerate_scans_index()
+    assert index_file.read_text().endswith("<!-- v2 -->")
+
+    # So does a change to how many rows a section shows.
+    index_file.write_text("sentinel")
+    monkeypatch.setattr(feedback, "_SCANS_INDEX_ARTICLE_LIMIT", 1)
+    feedback.regenerate_scans_index()
+    assert "row-hidden" in index_file.read_text()
+
+
 def test_feedback_templates_use_current_payload_and_background_scan_routes():
     daily = (ROOT / "domains/curator/templates/curator_briefing.html").read_text()
     library = (ROOT / "domains/curator/templates/curator_library.html").read_text()